@@ -1,11 +1,12 @@
 """Constants for Valentina models."""
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, StrEnum
 from pathlib import Path
 from random import choice
-from typing import TypedDict
+from typing import Any, TypedDict
 
 import inflect
 
@@ -13,6 +14,28 @@ import inflect
 p = inflect.engine()
 
 
+def _percentile_lookup(ranges: Iterable[tuple[Any, tuple[int, int] | None]]) -> dict[int, Any]:
+    """Map every number in each member's inclusive range to that member.
+
+    Enum members and their ranges are fixed at import, so build the table once and let `get_member_by_value` lookups index it rather than scanning every member. Members without a range are skipped and, where ranges overlap, the first member keeps the number.
+
+    Args:
+        ranges (Iterable[tuple[Any, tuple[int, int] | None]]): (member, (min, max)) pairs in member order.
+
+    Returns:
+        dict[int, Any]: The member for each number covered by a range.
+    """
+    lookup: dict[int, Any] = {}
+    for member, value_range in ranges:
+        if not value_range:
+            continue
+        min_val, max_val = value_range
+        for number in range(min_val, max_val + 1):
+            lookup.setdefault(number, member)
+
+    return lookup
+
+
 ### Single constants ###
 ABS_MAX_EMBED_CHARACTERS = 3900  # Absolute maximum number of characters in an embed -100 for safety
 CHANGELOG_EXCLUDE_CATEGORIES = [
@@ -42,6 +65,7 @@ MAX_DOT_DISPLAY = 5  # number of dots to display on a character sheet before con
 MAX_FIELD_COUNT = 1010
 MAX_OPTION_LIST_SIZE = 25  # maximum number of options in a discord select menu
 MAX_POOL_SIZE = 100  # maximum number of dice that can be rolled
+NAME_GENDERS = ("male", "female")  # genders accepted by random name generation
 PREF_MAX_EMBED_CHARACTERS = 1950  # Preferred maximum number of characters in an embed
 SPACER = "\u200b"  # Zero-width space
 VALID_IMAGE_EXTENSIONS = frozenset(["png", "jpg", "jpeg", "gif", "webp"])
@@ -489,12 +513,8 @@ class CharClass(Enum):
         Returns:
             Optional[str]: The name of the enum member if found, otherwise None.
         """
-        for member in cls:
-            if not member.value.percentile_range:
-                continue
-            min_val, max_val = member.value.percentile_range
-            if min_val <= number <= max_val:
-                return member
+        if (member := _CHAR_CLASS_BY_PERCENTILE.get(number)) is not None:
+            return member
 
         msg = f"Value {number} not found in any CharClass range"
         raise ValueError(msg)
@@ -506,16 +526,20 @@ class CharClass(Enum):
         Returns:
             CharClass: A random enum member.
         """
-        return choice([x for x in cls if x.value.playable])
+        return choice(_PLAYABLE_CHAR_CLASSES)
 
     @classmethod
-    def playable_classes(cls) -> list["CharClass"]:
-        """Return a list of playable classes.
+    def playable_classes(cls) -> tuple["CharClass", ...]:
+        """Return the playable classes.
 
         Returns:
-            list[CharClass]: A list of playable classes.
+            tuple[CharClass, ...]: The playable classes, in member order.
         """
-        return [x for x in cls if x.value.playable]
+        return _PLAYABLE_CHAR_CLASSES
+
+
+_CHAR_CLASS_BY_PERCENTILE = _percentile_lookup((x, x.value.percentile_range) for x in CharClass)
+_PLAYABLE_CHAR_CLASSES = tuple(x for x in CharClass if x.value.playable)
 
 
 class CharGenHumans(Enum):
@@ -536,12 +560,10 @@ class CharGenHumans(Enum):
         Returns:
             Optional[str]: The name of the enum member if found, otherwise None.
         """
-        for member in cls:
-            min_val, max_val = member.value
-            if min_val <= value <= max_val:
-                return member
+        return _CHARGEN_HUMANS_BY_PERCENTILE.get(value)
+
 
-        return None
+_CHARGEN_HUMANS_BY_PERCENTILE = _percentile_lookup((x, x.value) for x in CharGenHumans)
 
 
 class InventoryItemType(Enum):
@@ -1039,11 +1061,7 @@ class HunterCreed(Enum):
         Returns:
             Optional[str]: The enum member if found, otherwise None.
         """
-        for member in cls:
-            min_val, max_val = member.value.range
-            if min_val <= value <= max_val:
-                return member
-        return None
+        return _HUNTER_CREED_BY_PERCENTILE.get(value)
 
     @classmethod
     def random_member(cls) -> "HunterCreed":
@@ -1055,6 +1073,9 @@ class HunterCreed(Enum):
         return choice(list(cls))
 
 
+_HUNTER_CREED_BY_PERCENTILE = _percentile_lookup((x, x.value.range) for x in HunterCreed)
+
+
 @dataclass(frozen=True, eq=True)
 class WerewolfBreedValue:
     """A value object for the WerewolfBreed enum."""
@@ -1395,7 +1416,10 @@ class VampireClan(Enum):
         Returns:
             VampireClan: A random enum member.
         """
-        return choice(list(cls))
+        return choice(_VAMPIRE_CLANS)
+
+
+_VAMPIRE_CLANS = tuple(VampireClan)
 
 
 class RNGCharLevel(Enum):
@@ -1420,7 +1444,10 @@ class RNGCharLevel(Enum):
         Returns:
             CharClass: A random enum member.
         """
-        return choice(list(cls))
+        return choice(_RNG_CHAR_LEVELS)
+
+
+_RNG_CHAR_LEVELS = tuple(RNGCharLevel)
 
 
 class ConceptAbilityDict(TypedDict):
@@ -1931,13 +1958,7 @@ class CharacterConcept(Enum):
         Returns:
             Optional[str]: The name of the enum member if found, otherwise None.
         """
-        for member in cls:
-            if not member.value.percentile_range:
-                continue
-            min_val, max_val = member.value.percentile_range
-            if min_val <= value <= max_val:
-                return member
-        return None
+        return _CONCEPT_BY_PERCENTILE.get(value)
 
     @classmethod
     def random_member(cls) -> "CharacterConcept":
@@ -1949,6 +1970,9 @@ class CharacterConcept(Enum):
         return choice(list(cls))
 
 
+_CONCEPT_BY_PERCENTILE = _percentile_lookup((x, x.value.percentile_range) for x in CharacterConcept)
+
+
 # CHANNEL_PERMISSIONS: Dictionary containing a tuple mapping of channel permissions.
 #     Format:
 #         default role permission,
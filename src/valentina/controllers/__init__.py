@@ -3,7 +3,7 @@
 from .channel_mngr import ChannelManager
 from .character_sheet_builder import CharacterSheetBuilder, TraitForCreation
 from .experience import total_campaign_experience
-from .model_mngr import delete_character
+from .model_mngr import delete_character, discard_draft_character
 from .permission_mngr import PermissionManager
 from .rng_chargen import RNGCharGen
 from .trait_modifier import TraitModifier
@@ -19,5 +19,6 @@ __all__ = [
     "TraitForCreation",
     "TraitModifier",
     "delete_character",
+    "discard_draft_character",
     "total_campaign_experience",
 ]
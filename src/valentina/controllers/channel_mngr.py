@@ -474,7 +474,7 @@ class ChannelManager:  # pragma: no cover
         if not category:
             return None
 
-        owned_by_user = discord.utils.get(self.guild.members, id=character.user_owner)
+        owned_by_user = self.guild.get_member(character.user_owner)
         channel_name = character.channel_name
         channel_db_id = character.channel
 
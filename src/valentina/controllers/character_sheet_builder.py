@@ -1,6 +1,7 @@
 """Controller for displaying a character sheet."""
 
 from dataclasses import dataclass, field
+from functools import cache
 from typing import assert_never
 
 from valentina.constants import CharClass, CharSheetSection, Emoji, TraitCategory
@@ -43,6 +44,31 @@ class SheetSection:
     categories: list[SectionCategory] = field(default_factory=list)
 
 
+@cache
+def _class_traits_for_creation(
+    category: TraitCategory, char_class: CharClass
+) -> tuple[TraitForCreation, ...]:
+    """Return the creatable traits for a category and character class.
+
+    The trait catalog is defined in code and does not change at runtime, so results are cached for the life of the process.
+
+    Args:
+        category (TraitCategory): The trait category.
+        char_class (CharClass): The character class.
+
+    Returns:
+        tuple[TraitForCreation, ...]: The traits available to the class within the category.
+    """
+    return tuple(
+        TraitForCreation(
+            name=trait_name,
+            category=category,
+            max_value=get_max_trait_value(trait_name, category.name),
+        )
+        for trait_name in category.get_all_class_trait_names(char_class=char_class)
+    )
+
+
 class CharacterSheetBuilder:
     """Controller for displaying a character sheet."""
 
@@ -98,29 +124,22 @@ class CharacterSheetBuilder:
         Returns:
             list[SheetSection]: A list of SheetSection objects representing the organized character sheet.
         """
+        char_class = self.character.char_class
+
         sheet: list[SheetSection] = []
         for section in CharSheetSection.get_members_in_order():
             if section == CharSheetSection.NONE:
                 continue
 
-            categories = []
-            for trait_cat in TraitCategory.get_members_in_order(
-                section=section, char_class=self.character.char_class
-            ):
-                traits_to_create = []
-                for trait_name in trait_cat.get_all_class_trait_names(
-                    char_class=self.character.char_class
-                ):
-                    trait_to_create = TraitForCreation(
-                        name=trait_name,
-                        category=trait_cat,
-                        max_value=get_max_trait_value(trait_name, trait_cat.name),
-                    )
-                    traits_to_create.append(trait_to_create)
-
-                categories.append(
-                    SectionCategory(category=trait_cat, traits_for_creation=traits_to_create)
+            categories = [
+                SectionCategory(
+                    category=trait_cat,
+                    traits_for_creation=list(_class_traits_for_creation(trait_cat, char_class)),
                 )
+                for trait_cat in TraitCategory.get_members_in_order(
+                    section=section, char_class=char_class
+                )
+            ]
 
             sheet.append(SheetSection(section=section, categories=categories))
 
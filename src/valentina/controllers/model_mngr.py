@@ -3,7 +3,7 @@
 from beanie import DeleteRules
 from loguru import logger
 
-from valentina.models import Character, User
+from valentina.models import Character, CharacterTrait, User
 
 from .channel_mngr import ChannelManager
 
@@ -36,3 +36,19 @@ async def delete_character(character: Character) -> None:
     await character.delete_all_images()
     await character.delete(link_rule=DeleteRules.DELETE_LINKS)
     logger.info(f"Deleted character {character.name} from guild {guild.name}")
+
+
+async def discard_draft_character(character: Character) -> None:
+    """Delete a generated character which was never confirmed by the user.
+
+    Draft characters, such as RNG chargen choices which were not selected or a storyteller character whose creation was cancelled, have no channel, images, inventory, notes, or place in their owner's character list. Skip the Discord, S3, and user cleanup done by `delete_character` and remove the traits with a single bulk delete rather than one delete per linked trait.
+
+    Args:
+        character (Character): The draft character document to delete.
+
+    Returns:
+        None
+    """
+    await CharacterTrait.find(CharacterTrait.character == str(character.id)).delete()
+    await character.delete()
+    logger.debug(f"Discarded draft character {character.name}")
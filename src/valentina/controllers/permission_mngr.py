@@ -27,6 +27,14 @@ class PermissionManager:
 
         return self._guild_db_obj.permissions
 
+    @staticmethod
+    async def _fetch_character(character_id: str, character: Character | None) -> Character:
+        """Return the provided character or fetch it from the database when not provided."""
+        if character is not None:
+            return character
+
+        return await Character.get(character_id)
+
     async def can_grant_xp(self, author_id: int, target_id: int) -> bool:
         """Determine if the user can grant XP.
 
@@ -95,7 +103,9 @@ class PermissionManager:
             case _:
                 assert_never()
 
-    async def can_manage_traits(self, author_id: int, character_id: str) -> bool:
+    async def can_manage_traits(
+        self, author_id: int, character_id: str, character: Character | None = None
+    ) -> bool:
         """Determine if the user has permission to manage traits for the specified character.
 
         Check the user's permissions against the guild's settings to decide if they
@@ -106,6 +116,7 @@ class PermissionManager:
         Args:
             author_id (int): The ID of the user requesting to manage the character's traits.
             character_id (str): The database ID of the character to manage.
+            character (Character, optional): The already loaded character. When provided, the character is not re-fetched from the database. Defaults to None.
 
         Returns:
             bool: True if the user has permission to manage the character's traits,
@@ -128,11 +139,11 @@ class PermissionManager:
                 return True
 
             case PermissionsManageTraits.CHARACTER_OWNER_ONLY:
-                character = await Character.get(character_id)
+                character = await self._fetch_character(character_id, character)
                 return (author_id == character.user_owner) or await self.is_storyteller(author_id)
 
             case PermissionsManageTraits.WITHIN_24_HOURS:
-                character = await Character.get(character_id)
+                character = await self._fetch_character(character_id, character)
                 author_is_owner = author_id == character.user_owner
                 is_within_24_hours = datetime.now(UTC) - character.date_created <= timedelta(
                     hours=24
@@ -148,7 +159,9 @@ class PermissionManager:
             case _:
                 assert_never()
 
-    async def can_kill_character(self, author_id: int, character_id: str) -> bool:
+    async def can_kill_character(
+        self, author_id: int, character_id: str, character: Character | None = None
+    ) -> bool:
         """Determine if the user has permission to kill the specified character.
 
         Check the user's permissions against the guild's settings to decide if they
@@ -158,6 +171,7 @@ class PermissionManager:
         Args:
             author_id (int): The ID of the user requesting to kill the character.
             character_id (str): The database ID of the character to kill.
+            character (Character, optional): The already loaded character. When provided, the character is not re-fetched from the database. Defaults to None.
 
         Returns:
             bool: True if the user has permission to kill the character, False otherwise.
@@ -178,7 +192,7 @@ class PermissionManager:
                 return True
 
             case PermissionsKillCharacter.CHARACTER_OWNER_ONLY:
-                character = await Character.get(character_id)
+                character = await self._fetch_character(character_id, character)
                 return author_id == character.user_owner or await self.is_storyteller(author_id)
 
             case PermissionsKillCharacter.STORYTELLER_ONLY:
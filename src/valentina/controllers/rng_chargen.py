@@ -171,9 +171,6 @@ class RNGCharGen:
         Returns:
             Character: The generated base character.
         """
-        # Grab random name
-        name_first, name_last = await fetch_random_name(gender=gender, country=nationality)
-
         # Grab a random class
         if char_class is None:
             percentile = random_num(100)
@@ -187,13 +184,16 @@ class RNGCharGen:
             concept = CharacterConcept.get_member_by_value(percentile)
 
         # Grab class specific information
-        if char_class == CharClass.VAMPIRE and not clan:
+        if char_class is CharClass.VAMPIRE and not clan:
             clan = VampireClan.random_member()  # type: ignore [unreachable]
 
-        if char_class == CharClass.HUNTER and not creed:
+        if char_class is CharClass.HUNTER and not creed:
             percentile = random_num(100)  # type: ignore [unreachable]
             creed = HunterCreed.get_member_by_value(percentile)
 
+        # Grab random name last, once every in-memory choice has been made, as it may need an HTTP request
+        name_first, name_last = await fetch_random_name(gender=gender, country=nationality)
+
         character = Character(
             name_first=name_first,
             name_last=name_last,
@@ -311,26 +311,28 @@ class RNGCharGen:
         tertiary_category = random.choice(attributes)
 
         # Assign dots to each attribute
-        for cat in [primary_category, secondary_category, tertiary_category]:
-            category_dots = total_dots.pop(0)
-
+        traits: list[CharacterTrait] = []
+        for cat, category_dots in zip(
+            [primary_category, secondary_category, tertiary_category], total_dots, strict=True
+        ):
             category_traits = cat.get_all_class_trait_names(CharClass[character.char_class_name])
 
             trait_values = divide_total_randomly(category_dots, len(category_traits), 5, 1)
 
-            # Create the attributes and assign them to the character
-            for t in category_traits:
-                trait = CharacterTrait(
+            # Create the attributes
+            traits.extend(
+                CharacterTrait(
                     name=t,
-                    value=trait_values.pop(0),
+                    value=value,
                     max_value=get_max_trait_value(t, cat.name),
                     character=str(character.id),
                     category_name=cat.name,
                 )
-                try:
-                    await character.add_trait(trait)
-                except errors.TraitExistsError as e:
-                    logger.warning(e)
+                for t, value in zip(category_traits, trait_values, strict=True)
+            )
+
+        # Assign the attributes to the character
+        await character.add_traits(traits)
 
         return character
 
@@ -375,31 +377,29 @@ class RNGCharGen:
         tertiary_category = random.choice(abilities)
 
         # Assign dots to each attribute
-        for cat in [primary_category, secondary_category, tertiary_category]:
-            category_dots = total_dots.pop(0)
-
+        all_traits: list[CharacterTrait] = []
+        for cat, category_dots in zip(
+            [primary_category, secondary_category, tertiary_category], total_dots, strict=True
+        ):
             category_traits = cat.get_all_class_trait_names(CharClass[character.char_class_name])
             trait_values = divide_total_randomly(category_dots, len(category_traits), 5, 0)
 
-            # Create the attributes and assign them to the character
+            # Create the abilities
             traits = [
                 CharacterTrait(
                     name=t,
-                    value=trait_values.pop(0),
+                    value=value,
                     max_value=get_max_trait_value(t, cat.name),
                     character=str(character.id),
                     category_name=cat.name,
                 )
-                for t in category_traits
+                for t, value in zip(category_traits, trait_values, strict=True)
             ]
 
-            traits = self._redistribute_trait_values(traits, concept)
+            all_traits.extend(self._redistribute_trait_values(traits, concept))
 
-            for trait in traits:
-                try:
-                    await character.add_trait(trait)
-                except errors.TraitExistsError as e:
-                    logger.warning(e)
+        # Assign the abilities to the character
+        await character.add_traits(all_traits)
 
         return character
 
@@ -431,7 +431,8 @@ class RNGCharGen:
             RNGCharLevel.ELITE: 3,
         }
 
-        disciplines_to_set = clan.value.disciplines
+        # Copy the clan's disciplines so the extra picks are not added to the enum itself
+        disciplines_to_set = list(clan.value.disciplines)
         other_disciplines = TraitCategory.DISCIPLINES.get_all_class_trait_names(
             CharClass[character.char_class_name]
         )
@@ -449,19 +450,19 @@ class RNGCharGen:
             for x in _rng.normal(mean, distribution, len(disciplines_to_set)).astype(int32)
         ]
 
-        # Create the attributes and assign them to the character
-        for t in disciplines_to_set:
-            trait = CharacterTrait(
-                name=t,
-                value=values.pop(0),
-                max_value=get_max_trait_value(t, TraitCategory.DISCIPLINES.name),
-                character=str(character.id),
-                category_name=TraitCategory.DISCIPLINES.name,
-            )
-            try:
-                await character.add_trait(trait)
-            except errors.TraitExistsError as e:
-                logger.warning(e)
+        # Create the disciplines and assign them to the character
+        await character.add_traits(
+            [
+                CharacterTrait(
+                    name=t,
+                    value=value,
+                    max_value=get_max_trait_value(t, TraitCategory.DISCIPLINES.name),
+                    character=str(character.id),
+                    category_name=TraitCategory.DISCIPLINES.name,
+                )
+                for t, value in zip(disciplines_to_set, values, strict=True)
+            ]
+        )
 
         return character
 
@@ -500,18 +501,18 @@ class RNGCharGen:
         values = divide_total_randomly(total_dots, len(virtues), max_value=5, min_value=1)
 
         # Create the traits and assign them to the character
-        for v in virtues:
-            trait = CharacterTrait(
-                name=v,
-                value=values.pop(0),
-                max_value=get_max_trait_value(v, TraitCategory.VIRTUES.name),
-                character=str(character.id),
-                category_name=TraitCategory.VIRTUES.name,
-            )
-            try:
-                await character.add_trait(trait)
-            except errors.TraitExistsError as e:
-                logger.warning(e)
+        await character.add_traits(
+            [
+                CharacterTrait(
+                    name=v,
+                    value=value,
+                    max_value=get_max_trait_value(v, TraitCategory.VIRTUES.name),
+                    character=str(character.id),
+                    category_name=TraitCategory.VIRTUES.name,
+                )
+                for v, value in zip(virtues, values, strict=True)
+            ]
+        )
 
         return character
 
@@ -550,18 +551,18 @@ class RNGCharGen:
         trait_values = divide_total_randomly(total_dots, len(backgrounds), 5, 0)
 
         # Create the backgrounds and assign them to the character
-        for b in backgrounds:
-            trait = CharacterTrait(
-                name=b,
-                value=trait_values.pop(0),
-                max_value=get_max_trait_value(b, TraitCategory.BACKGROUNDS.name),
-                character=str(character.id),
-                category_name=TraitCategory.BACKGROUNDS.name,
-            )
-            try:
-                await character.add_trait(trait)
-            except errors.TraitExistsError as e:
-                logger.warning(e)
+        await character.add_traits(
+            [
+                CharacterTrait(
+                    name=b,
+                    value=value,
+                    max_value=get_max_trait_value(b, TraitCategory.BACKGROUNDS.name),
+                    character=str(character.id),
+                    category_name=TraitCategory.BACKGROUNDS.name,
+                )
+                for b, value in zip(backgrounds, trait_values, strict=True)
+            ]
+        )
 
         return character
 
@@ -691,18 +692,18 @@ class RNGCharGen:
         trait_values = divide_total_randomly(total_dots, len(edges), 5, 0)
 
         # Create the edges and assign them to the character
-        for edge in edges:
-            trait = CharacterTrait(
-                name=edge,
-                value=trait_values.pop(0),
-                max_value=get_max_trait_value(edge, TraitCategory.EDGES.name),
-                character=str(character.id),
-                category_name=TraitCategory.EDGES.name,
-            )
-            try:
-                await character.add_trait(trait)
-            except errors.TraitExistsError as e:
-                logger.warning(e)
+        await character.add_traits(
+            [
+                CharacterTrait(
+                    name=edge,
+                    value=value,
+                    max_value=get_max_trait_value(edge, TraitCategory.EDGES.name),
+                    character=str(character.id),
+                    category_name=TraitCategory.EDGES.name,
+                )
+                for edge, value in zip(edges, trait_values, strict=True)
+            ]
+        )
 
         return character
 
@@ -727,18 +728,18 @@ class RNGCharGen:
         # Assign Traits
         for ability in character.concept.value.abilities:
             if isinstance(ability["traits"], list):
-                for name, value, category in ability["traits"]:
-                    trait = CharacterTrait(
-                        name=name,
-                        value=value,
-                        max_value=get_max_trait_value(name, category),
-                        character=str(character.id),
-                        category_name=category,
-                    )
-                    try:
-                        await character.add_trait(trait)
-                    except errors.TraitExistsError as e:
-                        logger.warning(e)
+                await character.add_traits(
+                    [
+                        CharacterTrait(
+                            name=name,
+                            value=value,
+                            max_value=get_max_trait_value(name, category),
+                            character=str(character.id),
+                            category_name=category,
+                        )
+                        for name, value, category in ability["traits"]
+                    ]
+                )
 
             if isinstance(ability["custom_sections"], list):
                 character.sheet_sections.extend(
@@ -788,10 +789,6 @@ class RNGCharGen:
             category_name=TraitCategory.OTHER.name,
             max_value=10,
         )
-        try:
-            await character.add_trait(willpower)
-        except errors.TraitExistsError as e:
-            logger.warning(e)
 
         gnosis = CharacterTrait(
             name="Gnosis",
@@ -800,7 +797,6 @@ class RNGCharGen:
             category_name=TraitCategory.OTHER.name,
             max_value=10,
         )
-        await character.add_trait(gnosis)
 
         rage = CharacterTrait(
             name="Rage",
@@ -809,7 +805,6 @@ class RNGCharGen:
             category_name=TraitCategory.OTHER.name,
             max_value=get_max_trait_value("Rage", TraitCategory.OTHER.name),
         )
-        await character.add_trait(rage)
 
         rank = CharacterTrait(
             name="Rank",
@@ -818,7 +813,6 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=5,
         )
-        await character.add_trait(rank)
 
         glory = CharacterTrait(
             name="Glory",
@@ -827,7 +821,6 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=get_max_trait_value("Glory", TraitCategory.RENOWN.name),
         )
-        await character.add_trait(glory)
 
         honor = CharacterTrait(
             name="Honor",
@@ -836,7 +829,6 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=get_max_trait_value("Honor", TraitCategory.RENOWN.name),
         )
-        await character.add_trait(honor)
 
         wisdom = CharacterTrait(
             name="Wisdom",
@@ -845,20 +837,21 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=get_max_trait_value("Wisdom", TraitCategory.RENOWN.name),
         )
-        await character.add_trait(wisdom)
 
         gifts = set(auspice.value.starting_gifts + breed.value.starting_gifts)
-        for gift in gifts:
-            trait = CharacterTrait(
+        gift_traits = [
+            CharacterTrait(
                 name=gift,
                 value=1,
                 character=str(character.id),
                 category_name=TraitCategory.GIFTS.name,
                 max_value=1,
             )
-            try:
-                await character.add_trait(trait)
-            except errors.TraitExistsError as e:
-                logger.warning(e)
+            for gift in gifts
+        ]
+
+        await character.add_traits(
+            [willpower, gnosis, rage, rank, glory, honor, wisdom, *gift_traits]
+        )
 
         return character
@@ -2,6 +2,8 @@
 
 from typing import TYPE_CHECKING
 
+from beanie import Link
+
 from valentina.constants import TraitCategory, XPMultiplier
 from valentina.models import Character, CharacterTrait, User
 from valentina.utils import errors
@@ -67,8 +69,8 @@ class TraitModifier:
     async def _save_trait(self, trait: CharacterTrait) -> CharacterTrait:
         """Save updates to a trait and ensure it's properly linked to the character.
 
-        This method fetches all character links, adds the trait to the character,
-        and saves the changes.
+        Traits already linked to the character only need their new value written, so the
+        character's links are fetched and the trait added only for traits new to the character.
 
         Args:
             trait (CharacterTrait): The trait to be saved and linked.
@@ -79,6 +81,11 @@ class TraitModifier:
         Raises:
             errors.TraitExistsError: If the trait already exists for the character.
         """
+        linked_ids = {x.ref.id if isinstance(x, Link) else x.id for x in self.character.traits}
+        if trait.id is not None and trait.id in linked_ids:
+            await trait.save()
+            return trait
+
         await self.character.fetch_all_links()
         await self.character.add_trait(trait)
         return trait
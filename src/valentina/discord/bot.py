@@ -1,8 +1,9 @@
 """The main file for the Valentina bot."""
 
 import asyncio
-import inspect
+import sys
 from datetime import UTC, datetime
+from functools import cached_property
 from typing import Any
 
 import discord
@@ -14,7 +15,7 @@ from discord.ext import commands, tasks
 from loguru import logger
 
 from valentina.constants import COGS_PATH, EmbedColor, LogLevel, WebUIEnvironment
-from valentina.controllers import TaskBroker
+from valentina.controllers import PermissionManager, TaskBroker
 from valentina.models import (
     ChangelogPoster,
     GlobalProperty,
@@ -25,6 +26,21 @@ from valentina.utils import ValentinaConfig, errors
 from valentina.utils.database import init_database
 from valentina.webui import create_app
 
+# Hold strong references to fire-and-forget tasks so they are not garbage collected before completion
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _finish_background_task(task: asyncio.Task) -> None:  # pragma: no cover
+    """Release a finished background task and log any exception it raised.
+
+    Args:
+        task (asyncio.Task): The completed task.
+    """
+    _background_tasks.discard(task)
+
+    if not task.cancelled() and (exc := task.exception()):
+        logger.opt(exception=exc).error(f"Background task {task.get_name()} failed")
+
 
 # Subclass discord.ApplicationContext to create custom application context
 class ValentinaContext(discord.ApplicationContext):
@@ -34,13 +50,21 @@ class ValentinaContext(discord.ApplicationContext):
     Implement logging capabilities and embed creation for consistent message formatting.
     """
 
+    @cached_property
+    def permission_manager(self) -> PermissionManager:  # pragma: no cover
+        """Return a permission manager for the guild shared by every check in this interaction.
+
+        The manager caches the guild document, so repeated permission checks while handling a single command only read the guild from the database once.
+        """
+        return PermissionManager(self.guild.id)
+
     def log_command(self, msg: str, level: LogLevel = LogLevel.INFO) -> None:  # pragma: no cover
         """Log the executed command with contextual information.
 
         Log the command details to both console and log file, including the author,
         command name, and channel where it was executed. Determine the appropriate
         log level and construct a detailed log message with the command's context.
-        Use introspection to identify the calling function and create a hierarchical
+        Walk the call frames to identify the calling module and create a hierarchical
         logger name for better traceability.
         """
         author = f"@{self.author.display_name}" if hasattr(self, "author") else None
@@ -49,24 +73,19 @@ class ValentinaContext(discord.ApplicationContext):
 
         command_info = [author, command, channel]
 
-        if (
-            inspect.stack()[1].function == "post_to_audit_log"
-            and inspect.stack()[2].function == "confirm_action"
-        ):
-            name1 = inspect.stack()[3].filename.split("/")[-3].split(".")[0]
-            name2 = inspect.stack()[3].filename.split("/")[-2].split(".")[0]
-            name3 = inspect.stack()[3].filename.split("/")[-1].split(".")[0]
-            new_name = f"{name1}.{name2}.{name3}"
-        elif inspect.stack()[1].function == "post_to_audit_log":
-            name1 = inspect.stack()[2].filename.split("/")[-3].split(".")[0]
-            name2 = inspect.stack()[2].filename.split("/")[-2].split(".")[0]
-            name3 = inspect.stack()[2].filename.split("/")[-1].split(".")[0]
-            new_name = f"{name1}.{name2}.{name3}"
-        else:
-            name1 = inspect.stack()[1].filename.split("/")[-3].split(".")[0]
-            name2 = inspect.stack()[1].filename.split("/")[-2].split(".")[0]
-            name3 = inspect.stack()[1].filename.split("/")[-1].split(".")[0]
-            new_name = f"{name1}.{name2}.{name3}"
+        # Name the log record after the module that issued the command, skipping the audit log
+        # helpers. Walk the frames directly because inspect.stack() reads source context for every
+        # frame on the stack.
+        caller = sys._getframe(1)  # noqa: SLF001
+        for helper in ("post_to_audit_log", "confirm_action"):
+            if caller.f_code.co_name != helper or caller.f_back is None:
+                break
+            caller = caller.f_back
+
+        new_name = ".".join(
+            part.split(".")[0] for part in caller.f_code.co_filename.split("/")[-3:]
+        )
+        del caller
 
         logger.patch(lambda r: r.update(name=new_name)).log(  # type: ignore [call-arg]
             level.value, f"{msg} [{', '.join([x for x in command_info if x])}]"
@@ -157,31 +176,43 @@ class ValentinaContext(discord.ApplicationContext):
     async def post_to_audit_log(self, message: str | discord.Embed) -> None:  # pragma: no cover
         """Send a message to the guild's audit log channel.
 
-        Convert the input message to an embed if it's a string, otherwise send the provided embed. Log the message content to the command log. Attempt to send the message to the guild's designated audit log channel.
+        Log the message content to the command log immediately. Posting to the guild's designated audit log channel is scheduled as a background task so the user's response is not delayed by an extra Discord API round-trip.
 
         Args:
             message (str | discord.Embed): The message or embed to send to the audit log.
-
-        Raises:
-            errors.MessageTooLongError: If the message exceeds Discord's character limit.
         """
-        # Get the database guild object and error log channel
-        guild = await Guild.get(self.guild.id)
-        audit_log_channel = guild.fetch_audit_log_channel(self.guild)
-
         if isinstance(message, str):
             self.log_command(message, LogLevel.INFO)
 
         if isinstance(message, discord.Embed):
             self.log_command(f"{message.title} {message.description}", LogLevel.INFO)
 
-        if audit_log_channel:
-            embed = self._message_to_embed(message) if isinstance(message, str) else message
+        task = asyncio.create_task(self._send_to_audit_log_channel(message))
+        _background_tasks.add(task)
+        task.add_done_callback(_finish_background_task)
 
-            try:
-                await audit_log_channel.send(embed=embed)
-            except discord.HTTPException as e:
-                raise errors.MessageTooLongError from e
+    async def _send_to_audit_log_channel(
+        self, message: str | discord.Embed
+    ) -> None:  # pragma: no cover
+        """Post a message to the guild's audit log channel if one is configured.
+
+        Convert the input message to an embed if it's a string, otherwise send the provided embed. Failures are logged rather than raised because this runs outside of the command's error handling.
+
+        Args:
+            message (str | discord.Embed): The message or embed to send to the audit log.
+        """
+        guild = await Guild.get(self.guild.id)
+        audit_log_channel = guild.fetch_audit_log_channel(self.guild)
+
+        if not audit_log_channel:
+            return
+
+        embed = self._message_to_embed(message) if isinstance(message, str) else message
+
+        try:
+            await audit_log_channel.send(embed=embed)
+        except discord.HTTPException as e:
+            logger.error(f"AUDIT LOG: Failed to post to {audit_log_channel.name}: {e}")
 
 
 class Valentina(commands.Bot):
@@ -206,6 +237,7 @@ class Valentina(commands.Bot):
     ):
         super().__init__(*args, **kwargs)
         self.connected = False
+        self.db_initialized = False
         self.welcomed = False
         self.version = version
         self.owner_channels = [int(x) for x in ValentinaConfig().owner_channels.split(",")]
@@ -226,18 +258,19 @@ class Valentina(commands.Bot):
         """Perform early setup tasks when the bot connects to Discord.
 
         Initialize the MongoDB database connection, retrying if necessary.
+        The database is only initialized on the first connection so that reconnects to Discord reuse the existing connection pool.
         Log connection details and bot information upon successful connection.
         Synchronize commands with Discord.
         """
         # Initialize the mongodb database
-        while True:
+        while not self.db_initialized:
             try:
                 await init_database()
             except pymongo.errors.ServerSelectionTimeoutError as e:
                 logger.error(f"DB: Failed to initialize database: {e}")
                 await asyncio.sleep(60)
             else:
-                break
+                self.db_initialized = True
 
         # Connect to discord
         if not self.connected:
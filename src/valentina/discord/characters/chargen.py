@@ -4,7 +4,6 @@ from typing import cast
 
 import discord
 import inflect
-from beanie import DeleteRules
 from discord.ext import pages
 from discord.ui import Button
 from loguru import logger
@@ -19,7 +18,7 @@ from valentina.constants import (
     RNGCharLevel,
     VampireClan,
 )
-from valentina.controllers import ChannelManager, RNGCharGen, delete_character
+from valentina.controllers import ChannelManager, RNGCharGen, discard_draft_character
 from valentina.discord.bot import Valentina, ValentinaContext
 from valentina.discord.views import ChangeNameModal, sheet_embed
 from valentina.models import Campaign, Character, User
@@ -457,7 +456,7 @@ class CharGenWizard:  # pragma: no cover
             msg = "No character was created."
 
         for character in characters:
-            await delete_character(character)
+            await discard_draft_character(character)
 
         embed = discord.Embed(
             title=f"{Emoji.CANCEL.value} Cancelled",
@@ -615,7 +614,7 @@ Once you select a character you can re-allocate dots and change the name, but yo
             # Delete the previously created characters
             logger.debug("Rerolling characters and deleting old ones.")
             for character in characters:
-                await delete_character(character)
+                await discard_draft_character(character)
 
             # Check if the user has enough XP to reroll
             if campaign_xp < 10:  # noqa: PLR2004
@@ -633,7 +632,7 @@ Once you select a character you can re-allocate dots and change the name, but yo
             for c in characters:
                 if c.id != selected_character.id:
                     # Delete the characters the user did not select
-                    await c.delete(link_rule=DeleteRules.DELETE_LINKS)
+                    await discard_draft_character(c)
 
                 if c.id == selected_character.id:
                     # Add the player into the database
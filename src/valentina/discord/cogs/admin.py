@@ -12,7 +12,7 @@ from discord.ext.commands import MemberConverter
 from valentina.constants import VALID_IMAGE_EXTENSIONS, RollResultType
 from valentina.controllers import ChannelManager, delete_character
 from valentina.discord.bot import Valentina, ValentinaContext
-from valentina.discord.utils import assert_permissions
+from valentina.discord.utils import HIDDEN_OPTION_DEFAULT_TRUE, assert_permissions
 from valentina.discord.utils.autocomplete import select_any_character, select_campaign
 from valentina.discord.utils.converters import ValidCampaign, ValidCharacterObject, ValidImageURL
 from valentina.discord.views import (
@@ -62,11 +62,7 @@ class AdminCog(commands.Cog):
     async def rebuild_campaign_channels(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Manage Guild Settings."""
         title = "Rebuild all campaign channels?"
@@ -101,11 +97,7 @@ class AdminCog(commands.Cog):
             autocomplete=select_campaign,
             required=True,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Associate a character with a campaign."""
         if character.campaign == str(campaign.id):
@@ -150,8 +142,6 @@ class AdminCog(commands.Cog):
         ),
     ) -> None:
         """Delete all campaign channels from Discord."""
-        guild = await Guild.get(ctx.guild.id, fetch_links=True)
-
         title = f"Delete all campaign channels from `{ctx.guild.name}`"
         is_confirmed, interaction, confirmation_embed = await confirm_action(
             ctx, title, hidden=hidden
@@ -159,6 +149,7 @@ class AdminCog(commands.Cog):
         if not is_confirmed:
             return
 
+        guild = await Guild.get(ctx.guild.id, fetch_links=True)
         channel_manager = ChannelManager(guild=ctx.guild)
         for campaign in guild.campaigns:
             await channel_manager.delete_campaign_channels(campaign)
@@ -206,11 +197,7 @@ class AdminCog(commands.Cog):
         member: discord.Member,
         role: discord.Role,
         reason: Option(str, description="Reason for adding role", default="No reason provided"),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add user to role."""
         # Confirm the action
@@ -234,11 +221,7 @@ class AdminCog(commands.Cog):
         member: discord.Member,
         role: discord.Role,
         reason: Option(str, description="Reason for removing role", default="No reason provided"),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add user to role."""
         # Confirm the action
@@ -262,11 +245,7 @@ class AdminCog(commands.Cog):
         member: discord.Member,
         *,
         reason: str = "No reason given",
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Kick a target member, by ID or mention."""
         if member.id == ctx.author.id:
@@ -298,11 +277,7 @@ class AdminCog(commands.Cog):
         user: discord.User,
         *,
         reason: str = "No reason given",
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Ban a target member, by ID or mention."""
         await assert_permissions(ctx, ban_members=True)
@@ -336,11 +311,7 @@ class AdminCog(commands.Cog):
         self,
         ctx: ValentinaContext,
         user: discord.User,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Revoke ban from a banned user."""
         # Confirm the action
@@ -377,11 +348,7 @@ class AdminCog(commands.Cog):
             description="The reason for the ban",
             default="No reason provided",
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Ban the supplied members from the guild. Limited to 10 at a time."""
         await assert_permissions(ctx, ban_members=True)
@@ -428,11 +395,7 @@ class AdminCog(commands.Cog):
     async def settings_manager(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Manage Guild Settings."""
         guild = await Guild.get(ctx.guild.id, fetch_links=True)
@@ -465,11 +428,7 @@ class AdminCog(commands.Cog):
             default=None,
         ),
         url: Option(ValidImageURL, description="URL of the image", required=False, default=None),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add a custom emoji to this guild."""
         await assert_permissions(ctx, manage_emojis=True)
@@ -517,11 +476,7 @@ class AdminCog(commands.Cog):
             description="The reason for deleting this emoji",
             default="No reason provided",
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a custom emoji from this guild."""
         await assert_permissions(ctx, manage_emojis=True)
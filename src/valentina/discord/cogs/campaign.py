@@ -2,17 +2,22 @@
 """Cog for the Campaign commands."""
 
 import asyncio
+from operator import attrgetter
 
 import discord
-import inflect
+from beanie.operators import In
 from discord.commands import Option
 from discord.ext import commands
 from loguru import logger
 
 from valentina.constants import MAX_FIELD_COUNT, EmbedColor
-from valentina.controllers import ChannelManager, PermissionManager
+from valentina.controllers import ChannelManager
 from valentina.discord.bot import Valentina, ValentinaContext
-from valentina.discord.utils import fetch_channel_object
+from valentina.discord.utils import (
+    HIDDEN_OPTION_DEFAULT_FALSE,
+    HIDDEN_OPTION_DEFAULT_TRUE,
+    fetch_channel_object,
+)
 from valentina.discord.utils.autocomplete import (
     select_book,
     select_campaign,
@@ -41,11 +46,16 @@ from valentina.models import (
     CampaignBook,
     CampaignBookChapter,
     CampaignNPC,
+    Character,
     Guild,
 )
-from valentina.utils.helpers import truncate_string
+from valentina.utils.helpers import pluralize, truncate_string
+
 
-p = inflect.engine()
+def _clean_title(value: str) -> str:
+    """Strip surrounding whitespace from modal input and title-case what remains."""
+    value = value.strip()
+    return value.title() if value else value
 
 
 class CampaignCog(commands.Cog):
@@ -63,9 +73,7 @@ class CampaignCog(commands.Cog):
 
     async def check_permissions(self, ctx: ValentinaContext) -> bool:
         """Check if the user has permissions to run the command."""
-        permission_mngr = PermissionManager(ctx.guild.id)
-
-        if not await permission_mngr.can_manage_campaign(ctx.author.id):
+        if not await ctx.permission_manager.can_manage_campaign(ctx.author.id):
             await present_embed(
                 ctx,
                 title="Permission error",
@@ -85,11 +93,7 @@ class CampaignCog(commands.Cog):
         self,
         ctx: ValentinaContext,
         name: Option(str, description="Name of the campaign", required=True),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Create a new campaign."""
         # TODO: Migrate to modal to allow setting campaign description
@@ -125,11 +129,7 @@ class CampaignCog(commands.Cog):
         self,
         ctx: ValentinaContext,
         date: Option(ValidYYYYMMDD, description="DOB in the format of YYYY-MM-DD", required=True),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Set current date of a campaign."""
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
@@ -155,11 +155,7 @@ class CampaignCog(commands.Cog):
             required=True,
             autocomplete=select_campaign,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a campaign."""
         if not await self.check_permissions(ctx):
@@ -196,16 +192,12 @@ class CampaignCog(commands.Cog):
     async def campaign_list(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """List all campaigns."""
         guild = await Guild.get(ctx.guild.id, fetch_links=True)
 
-        if len(guild.campaigns) == 0:
+        if not guild.campaigns:
             await present_embed(
                 ctx,
                 title="No campaigns",
@@ -215,17 +207,41 @@ class CampaignCog(commands.Cog):
             )
             return
 
-        text = f"## {len(guild.campaigns)} {p.plural_noun('campaign', len(guild.campaigns))} on `{ctx.guild.name}`\n"
-        for c in sorted(guild.campaigns, key=lambda x: x.name):
-            characters = await c.fetch_player_characters()
-            text += f"### **{c.name}**\n"
-            text += f"{c.description}\n" if c.description else ""
-            text += f"- `{len(c.books)}` {p.plural_noun('book', len(c.books))}\n"
-            text += f"- `{len(c.npcs)}` NPCs\n"
-            text += f"- `{len(characters)}` {p.plural_noun('character', len(characters))}\n"
+        # Count player characters for every campaign in one query instead of one query per campaign
+        character_counts = {
+            result["_id"]: result["count"]
+            for result in await Character.find(
+                In(Character.campaign, [str(c.id) for c in guild.campaigns]),
+                Character.type_player == True,  # noqa: E712
+            )
+            .aggregate([{"$group": {"_id": "$campaign", "count": {"$sum": 1}}}])
+            .to_list()
+        }
+
+        # Collect the lines and join once rather than growing a string per campaign
+        num_campaigns = len(guild.campaigns)
+        lines = [f"## {num_campaigns} {pluralize('campaign', num_campaigns)} on `{ctx.guild.name}`"]
+        for c in sorted(guild.campaigns, key=attrgetter("name")):
+            num_books = len(c.books)
+            num_characters = character_counts.get(str(c.id), 0)
+            lines.append(f"### **{c.name}**")
+            if c.description:
+                lines.append(c.description)
+            lines.extend(
+                [
+                    f"- `{num_books}` {pluralize('book', num_books)}",
+                    f"- `{len(c.npcs)}` NPCs",
+                    f"- `{num_characters}` {pluralize('character', num_characters)}",
+                ]
+            )
 
         await auto_paginate(
-            ctx=ctx, title="", text=text, color=EmbedColor.INFO, hidden=hidden, max_chars=900
+            ctx=ctx,
+            title="",
+            text="\n".join(lines) + "\n",
+            color=EmbedColor.INFO,
+            hidden=hidden,
+            max_chars=900,
         )
 
     ### NPC COMMANDS ####################################################################
@@ -234,11 +250,7 @@ class CampaignCog(commands.Cog):
     async def create_npc(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Create a new NPC."""
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
@@ -250,8 +262,8 @@ class CampaignCog(commands.Cog):
         if not modal.confirmed:
             return
 
-        name = modal.name.strip().title()
-        npc_class = modal.npc_class.strip().title()
+        name = _clean_title(modal.name)
+        npc_class = _clean_title(modal.npc_class)
         description = modal.description.strip()
 
         npc = CampaignNPC(name=name, npc_class=npc_class, description=description)
@@ -280,17 +292,13 @@ class CampaignCog(commands.Cog):
     async def list_npcs(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """List all NPCs."""
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
         campaign = channel_objects.campaign
 
-        if len(campaign.npcs) == 0:
+        if not campaign.npcs:
             await present_embed(
                 ctx,
                 title="No NPCs",
@@ -300,16 +308,13 @@ class CampaignCog(commands.Cog):
             )
             return
 
-        fields = []
-        fields.extend(
-            [
-                (
-                    f"**__{npc.name}__**",
-                    f"**Class:** {npc.npc_class}\n**Description:** {npc.description}",
-                )
-                for npc in sorted(campaign.npcs, key=lambda x: x.name)
-            ]
-        )
+        fields = [
+            (
+                f"**__{npc.name}__**",
+                f"**Class:** {npc.npc_class}\n**Description:** {npc.description}",
+            )
+            for npc in sorted(campaign.npcs, key=attrgetter("name"))
+        ]
 
         await present_embed(ctx, title="NPCs", fields=fields, level="info", ephemeral=hidden)
 
@@ -324,11 +329,7 @@ class CampaignCog(commands.Cog):
             required=True,
             autocomplete=select_npc,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Edit an NPC."""
         if not await self.check_permissions(ctx):
@@ -355,8 +356,8 @@ class CampaignCog(commands.Cog):
         if not modal.confirmed:
             return
 
-        name = modal.name.strip().title()
-        npc_class = modal.npc_class.strip().title()
+        name = _clean_title(modal.name)
+        npc_class = _clean_title(modal.npc_class)
         description = modal.description.strip()
 
         campaign.npcs[index].name = name
@@ -373,9 +374,9 @@ class CampaignCog(commands.Cog):
                 ("Class", npc_class),
                 (
                     "Description",
-                    (modal.description.strip()[:MAX_FIELD_COUNT] + " ...")
-                    if len(modal.description.strip()) > MAX_FIELD_COUNT
-                    else modal.description.strip(),
+                    (description[:MAX_FIELD_COUNT] + " ...")
+                    if len(description) > MAX_FIELD_COUNT
+                    else description,
                 ),
             ],
             ephemeral=hidden,
@@ -389,11 +390,7 @@ class CampaignCog(commands.Cog):
         index: Option(
             int, name="npc", description="NPC to edit", required=True, autocomplete=select_npc
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete an NPC."""
         if not await self.check_permissions(ctx):
@@ -433,11 +430,7 @@ class CampaignCog(commands.Cog):
     async def create_book(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Create a new book."""
         if not await self.check_permissions(ctx):
@@ -454,7 +447,7 @@ class CampaignCog(commands.Cog):
 
         books = await campaign.fetch_books()
 
-        name = modal.name.strip().title()
+        name = _clean_title(modal.name)
         description_short = modal.description_short.strip()
         description_long = modal.description_long.strip()
         chapter_number = max([c.number for c in books], default=0) + 1
@@ -488,18 +481,14 @@ class CampaignCog(commands.Cog):
     async def list_books(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """List all books."""
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
         campaign = channel_objects.campaign
-        all_books = await campaign.fetch_books()
+        all_books = await campaign.fetch_books()  # Sorted by number
 
-        if len(all_books) == 0:
+        if not all_books:
             await present_embed(
                 ctx,
                 title="No books",
@@ -509,16 +498,13 @@ class CampaignCog(commands.Cog):
             )
             return
 
-        fields = []
-        fields.extend(
-            [
-                (
-                    f"**{book.number}.** **__{book.name}__** ({len(book.chapters)} chapters)",
-                    f"{book.description_short}",
-                )
-                for book in sorted(all_books, key=lambda x: x.number)
-            ]
-        )
+        fields = [
+            (
+                f"**{book.number}.** **__{book.name}__** ({len(book.chapters)} chapters)",
+                f"{book.description_short}",
+            )
+            for book in all_books
+        ]
 
         await present_embed(ctx, title=f"All Books in {campaign.name}", fields=fields, level="info")
 
@@ -534,11 +520,7 @@ class CampaignCog(commands.Cog):
             required=True,
             autocomplete=select_book,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Edit a chapter."""
         if not await self.check_permissions(ctx):
@@ -554,7 +536,7 @@ class CampaignCog(commands.Cog):
         if not modal.confirmed:
             return
 
-        name = modal.name.strip().title()
+        name = _clean_title(modal.name)
         description_short = modal.description_short.strip()
         description_long = modal.description_long.strip()
 
@@ -589,11 +571,7 @@ class CampaignCog(commands.Cog):
             required=True,
             autocomplete=select_book,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a chapter."""
         if not await self.check_permissions(ctx):
@@ -640,11 +618,7 @@ class CampaignCog(commands.Cog):
             description="New chapter number",
             required=True,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Renumber books."""
         if not await self.check_permissions(ctx):
@@ -714,11 +688,7 @@ class CampaignCog(commands.Cog):
     async def create_chapter(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default false).",
-            default=False,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_FALSE,
     ) -> None:
         """Create a new chapter."""
         if not await self.check_permissions(ctx):
@@ -742,7 +712,7 @@ class CampaignCog(commands.Cog):
         if not modal.confirmed:
             return
 
-        name = modal.name.strip().title()
+        name = _clean_title(modal.name)
         description_short = modal.description_short.strip()
         description_long = modal.description_long.strip()
         chapter_number = max([c.number for c in await book.fetch_chapters()], default=0) + 1
@@ -773,11 +743,7 @@ class CampaignCog(commands.Cog):
     async def list_chapters(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """List all chapters."""
         channel_objects = await fetch_channel_object(ctx, need_book=True)
@@ -792,9 +758,9 @@ class CampaignCog(commands.Cog):
             )
             return
 
-        chapters = await book.fetch_chapters()
+        chapters = await book.fetch_chapters()  # Sorted by number
 
-        if len(chapters) == 0:
+        if not chapters:
             await present_embed(
                 ctx,
                 title="No Chapters",
@@ -804,16 +770,13 @@ class CampaignCog(commands.Cog):
             )
             return
 
-        fields = []
-        fields.extend(
-            [
-                (
-                    f"**{chapter.number}.** **__{chapter.name}__**",
-                    f"{chapter.description_short}",
-                )
-                for chapter in sorted(chapters, key=lambda x: x.number)
-            ]
-        )
+        fields = [
+            (
+                f"**{chapter.number}.** **__{chapter.name}__**",
+                f"{chapter.description_short}",
+            )
+            for chapter in chapters
+        ]
 
         await present_embed(ctx, title="Chapters", fields=fields, level="info")
 
@@ -829,11 +792,7 @@ class CampaignCog(commands.Cog):
             required=True,
             autocomplete=select_chapter,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default false).",
-            default=False,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_FALSE,
     ) -> None:
         """Edit a chapter."""
         if not await self.check_permissions(ctx):
@@ -857,7 +816,7 @@ class CampaignCog(commands.Cog):
         if not modal.confirmed:
             return
 
-        name = modal.name.strip().title()
+        name = _clean_title(modal.name)
         description_short = modal.description_short.strip()
         description_long = modal.description_long.strip()
 
@@ -887,11 +846,7 @@ class CampaignCog(commands.Cog):
             required=True,
             autocomplete=select_chapter,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default False).",
-            default=False,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_FALSE,
     ) -> None:
         """Delete a chapter."""
         if not await self.check_permissions(ctx):
@@ -938,11 +893,7 @@ class CampaignCog(commands.Cog):
             description="New chapter number",
             required=True,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Renumber chapters."""
         if not await self.check_permissions(ctx):
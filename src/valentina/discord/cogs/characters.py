@@ -1,6 +1,7 @@
 # mypy: disable-error-code="valid-type"
 """Character cog for Valentina."""
 
+import asyncio
 from pathlib import Path
 
 import discord
@@ -15,10 +16,10 @@ from valentina.constants import (
     Emoji,
     RNGCharLevel,
 )
-from valentina.controllers import ChannelManager, PermissionManager
+from valentina.controllers import ChannelManager
 from valentina.discord.bot import Valentina, ValentinaContext
 from valentina.discord.characters import AddFromSheetWizard, CharGenWizard
-from valentina.discord.utils import fetch_channel_object
+from valentina.discord.utils import HIDDEN_OPTION_DEFAULT_TRUE, fetch_channel_object
 from valentina.discord.utils.autocomplete import (
     select_any_player_character,
     select_campaign,
@@ -59,6 +60,11 @@ from valentina.utils.helpers import (
 p = inflect.engine()
 
 
+def _section_slug(title: str) -> str:
+    """Normalize a custom section title for duplicate detection."""
+    return title.replace("-", "_").replace(" ", "_").lower()
+
+
 class CharactersCog(commands.Cog, name="Character"):
     """Create, manage, and update characters."""
 
@@ -74,20 +80,18 @@ class CharactersCog(commands.Cog, name="Character"):
     trait = chars.create_subgroup("trait", "Work with character traits")
     admin = chars.create_subgroup("admin", "Admin commands for characters")
 
-    async def check_mng_trait_perms(self, ctx: ValentinaContext, character_id: str) -> bool:
+    async def check_mng_trait_perms(self, ctx: ValentinaContext, character: Character) -> bool:
         """Check if the user has permissions to run a command that manages traits.
 
         Args:
             ctx (ValentinaContext): The context of the command
-            character_id (str): The character ID
+            character (Character): The character
 
         Returns:
             bool: True if the user has permissions; otherwise, False
         """
-        permission_mngr = PermissionManager(ctx.guild.id)
-
-        if not await permission_mngr.can_manage_traits(
-            author_id=ctx.author.id, character_id=character_id
+        if not await ctx.permission_manager.can_manage_traits(
+            author_id=ctx.author.id, character_id=str(character.id), character=character
         ):
             await present_embed(
                 ctx,
@@ -135,7 +139,7 @@ class CharactersCog(commands.Cog, name="Character"):
             vampire_clan (VampireClan, optional): The character's vampire clan. Defaults to None.
         """
         # Require a clan for vampires
-        if char_class == CharClass.VAMPIRE and not vampire_clan:
+        if char_class is CharClass.VAMPIRE and not vampire_clan:
             await present_embed(
                 ctx,
                 title="Vampire clan required",
@@ -144,10 +148,13 @@ class CharactersCog(commands.Cog, name="Character"):
             )
             return
 
-        channel_objects = await fetch_channel_object(ctx, need_campaign=True)
+        # The channel lookup and the user lookup are independent, so run them concurrently
+        channel_objects, user = await asyncio.gather(
+            fetch_channel_object(ctx, need_campaign=True),
+            User.get(ctx.author.id, fetch_links=True),
+        )
         campaign = channel_objects.campaign
 
-        user = await User.get(ctx.author.id, fetch_links=True)
         character = Character(
             guild=ctx.guild.id,
             name_first=first_name,
@@ -171,11 +178,12 @@ class CharactersCog(commands.Cog, name="Character"):
         ctx: ValentinaContext,
     ) -> None:
         """Create a new character from scratch."""
-        channel_objects = await fetch_channel_object(ctx, need_campaign=True)
+        # Grab the campaign and the current user concurrently
+        channel_objects, user = await asyncio.gather(
+            fetch_channel_object(ctx, need_campaign=True),
+            User.get(ctx.author.id, fetch_links=True),
+        )
         campaign = channel_objects.campaign
-
-        # Grab the current user and campaign experience
-        user = await User.get(ctx.author.id, fetch_links=True)
         campaign_xp, _, _ = user.fetch_campaign_xp(campaign)
 
         # Abort if user does not have enough xp
@@ -231,13 +239,15 @@ class CharactersCog(commands.Cog, name="Character"):
         ),
     ) -> None:
         """List all player characters in this guild."""
-        all_characters = await Character.find_many(
+        query = Character.find_many(
             Character.guild == ctx.guild.id,
             Character.type_player == True,  # noqa: E712
-        ).to_list()
-
+        )
         if scope == "mine":
-            all_characters = [x for x in all_characters if x.user_owner == ctx.user.id]
+            query = query.find(Character.user_owner == ctx.user.id)
+
+        # Sort in the database so the list arrives ordered by name
+        all_characters = await query.sort(+Character.name_first, +Character.name_last).to_list()
 
         if len(all_characters) == 0:
             await present_embed(
@@ -251,7 +261,7 @@ class CharactersCog(commands.Cog, name="Character"):
 
         title_prefix = "All" if scope == "all" else "Your"
         text = f"## {title_prefix} {p.plural_noun('character', len(all_characters))} on `{ctx.guild.name}`\n"
-        for character in sorted(all_characters, key=lambda x: x.name):
+        for character in all_characters:
             user = await User.get(character.user_owner, fetch_links=True)
             dead_emoji = Emoji.DEAD.value if not character.is_alive else ""
 
@@ -276,8 +286,9 @@ class CharactersCog(commands.Cog, name="Character"):
         character = channel_objects.character
         campaign = channel_objects.campaign
 
-        permission_mngr = PermissionManager(ctx.guild.id)
-        if not await permission_mngr.can_kill_character(ctx.author.id, str(character.id)):
+        if not await ctx.permission_manager.can_kill_character(
+            ctx.author.id, str(character.id), character=character
+        ):
             await present_embed(
                 ctx,
                 title="Permission error",
@@ -312,11 +323,7 @@ class CharactersCog(commands.Cog, name="Character"):
         first_name: Option(ValidCharacterName, "Character's name", required=True),
         last_name: Option(ValidCharacterName, "Character's last name", required=True),
         nickname: Option(ValidCharacterName, "Character's nickname", required=False, default=None),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Rename a character."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -468,17 +475,13 @@ class CharactersCog(commands.Cog, name="Character"):
             max_value=20,
             default=None,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add a trait to a character."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
         character = channel_objects.character
 
-        if not await self.check_mng_trait_perms(ctx, str(character.id)):
+        if not await self.check_mng_trait_perms(ctx, character):
             return
 
         title = f"Add trait: `{name.title()}` at `{value}` dots for {character.name}"
@@ -512,17 +515,13 @@ class CharactersCog(commands.Cog, name="Character"):
         new_value: Option(
             int, description="New value for the trait", required=True, min_value=0, max_value=20
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update the value of a trait."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
         character = channel_objects.character
 
-        if not await self.check_mng_trait_perms(ctx, str(character.id)):
+        if not await self.check_mng_trait_perms(ctx, character):
             return
 
         if not 0 <= new_value <= trait.max_value:
@@ -561,17 +560,13 @@ class CharactersCog(commands.Cog, name="Character"):
             required=True,
             autocomplete=select_char_trait,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a trait from a character."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
         character = channel_objects.character
 
-        if not await self.check_mng_trait_perms(ctx, str(character.id)):
+        if not await self.check_mng_trait_perms(ctx, character):
             return
 
         title = f"Delete trait `{trait.name}` from `{character.name}`"
@@ -586,10 +581,7 @@ class CharactersCog(commands.Cog, name="Character"):
         if not is_confirmed:
             return
 
-        character.traits.remove(trait)
-        await character.save()
-
-        await trait.delete()
+        await character.delete_trait(trait.id)
 
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
 
@@ -599,11 +591,7 @@ class CharactersCog(commands.Cog, name="Character"):
     async def add_custom_section(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add a custom section to the character sheet."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -615,12 +603,12 @@ class CharactersCog(commands.Cog, name="Character"):
         await ctx.send_modal(modal)
         await modal.wait()
 
-        section_title = modal.section_title.strip().title()
-        section_content = modal.section_content.strip()
+        section_title = modal.section_title
+        section_content = modal.section_content
 
-        if section_title.replace("-", "_").replace(" ", "_").lower() in [
-            x.title.replace("-", "_").replace(" ", "_").lower() for x in character.sheet_sections
-        ]:
+        if _section_slug(section_title) in {
+            _section_slug(x.title) for x in character.sheet_sections
+        }:
             msg = f"Custom section `{section_title}`already exists"
             raise errors.ValidationError(msg)
 
@@ -649,11 +637,7 @@ class CharactersCog(commands.Cog, name="Character"):
             required=True,
             autocomplete=select_custom_section,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update a custom section."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -669,8 +653,8 @@ class CharactersCog(commands.Cog, name="Character"):
         await ctx.send_modal(modal)
         await modal.wait()
 
-        section.title = modal.section_title.strip().title()
-        section.content = modal.section_content.strip()
+        section.title = modal.section_title
+        section.content = modal.section_content
 
         character.sheet_sections[section_index] = section
         await character.save()
@@ -696,11 +680,7 @@ class CharactersCog(commands.Cog, name="Character"):
             required=True,
             autocomplete=select_custom_section,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a custom section from a character."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -726,11 +706,7 @@ class CharactersCog(commands.Cog, name="Character"):
     async def update_bio(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update a character's bio."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -763,11 +739,7 @@ class CharactersCog(commands.Cog, name="Character"):
         self,
         ctx: ValentinaContext,
         dob: Option(ValidYYYYMMDD, description="DOB in the format of YYYY-MM-DD", required=True),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Set the DOB of a character."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -789,11 +761,7 @@ class CharactersCog(commands.Cog, name="Character"):
     async def update_profile(
         self,
         ctx: ValentinaContext,
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update a character's profile."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -804,20 +772,26 @@ class CharactersCog(commands.Cog, name="Character"):
         )
         await ctx.send_modal(modal)
         await modal.wait()
-        if modal.confirmed:
-            for k, v in modal.results.items():
-                if v:
-                    character.__dict__[k] = v
+        if not modal.confirmed:
+            return
 
-            await character.save()
+        # Only write fields that were filled in and differ from the stored values
+        update_data = {
+            k: v for k, v in modal.results.items() if v and v != getattr(character, k, None)
+        }
+        if not update_data:
+            return
 
-            await ctx.post_to_audit_log(f"Update profile for `{character.name}`")
-            await present_embed(
-                ctx,
-                title=f"Update profile for `{character.name}`",
-                level="success",
-                ephemeral=hidden,
-            )
+        character.__dict__.update(update_data)
+        await character.save()
+
+        await ctx.post_to_audit_log(f"Update profile for `{character.name}`")
+        await present_embed(
+            ctx,
+            title=f"Update profile for `{character.name}`",
+            level="success",
+            ephemeral=hidden,
+        )
 
     ### ADMIN COMMANDS ####################################################################
     @admin.command(name="campaign", description="Associate character with a campaign")
@@ -831,11 +805,7 @@ class CharactersCog(commands.Cog, name="Character"):
             required=True,
             autocomplete=select_campaign,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Associate a character with a campaign."""
         channel_objects = await fetch_channel_object(ctx, need_character=True)
@@ -1,20 +1,24 @@
 # mypy: disable-error-code="valid-type"
 """Experience commands."""
 
+import asyncio
+
 import discord
-import inflect
 from discord.commands import Option
 from discord.ext import commands
 
 from valentina.controllers import PermissionManager, TraitModifier
 from valentina.discord.bot import Valentina, ValentinaContext
-from valentina.discord.utils import fetch_channel_object
+from valentina.discord.utils import HIDDEN_OPTION_DEFAULT_FALSE, fetch_channel_object
 from valentina.discord.utils.autocomplete import select_char_trait
 from valentina.discord.utils.converters import ValidTraitFromID
 from valentina.discord.views import confirm_action, present_embed
 from valentina.models import User
+from valentina.utils.helpers import pluralize
 
-p = inflect.engine()
+# Uses of each experience-changing command allowed per user within the window, in seconds
+XP_COMMAND_RATE = 3
+XP_COMMAND_PER = 10
 
 
 class Experience(commands.Cog):
@@ -26,23 +30,32 @@ class Experience(commands.Cog):
     xp = discord.SlashCommandGroup("xp", "Add, spend, or view experience points")
 
     @xp.command(name="add", description="Add experience to a user")
+    @commands.cooldown(XP_COMMAND_RATE, XP_COMMAND_PER, commands.BucketType.user)
     async def xp_add(
         self,
         ctx: ValentinaContext,
-        amount: Option(int, description="The amount of experience to add", required=True),
+        amount: Option(
+            int, description="The amount of experience to add", required=True, min_value=1
+        ),
         user: Option(
             discord.User,
             description="The user to grant experience to",
             required=False,
             default=None,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default false).",
-            default=False,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_FALSE,
     ) -> None:
         """Add experience to a user."""
+        if amount < 1:
+            await present_embed(
+                ctx,
+                title="Invalid amount",
+                description="Amount must be at least `1`",
+                level="error",
+                ephemeral=True,
+            )
+            return
+
         if not user:
             user = await User.get(ctx.author.id)
         else:
@@ -77,23 +90,32 @@ class Experience(commands.Cog):
         await msg.edit_original_response(embed=confirmation_embed, view=None)
 
     @xp.command(name="add_cool_point", description="Add a cool point to a user")
+    @commands.cooldown(XP_COMMAND_RATE, XP_COMMAND_PER, commands.BucketType.user)
     async def cp_add(
         self,
         ctx: ValentinaContext,
-        amount: Option(int, description="The amount of experience to add (default 1)", default=1),
+        amount: Option(
+            int, description="The amount of experience to add (default 1)", default=1, min_value=1
+        ),
         user: Option(
             discord.User,
             description="The user to grant experience to",
             required=False,
             default=None,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default false).",
-            default=False,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_FALSE,
     ) -> None:
         """Add cool points to a user."""
+        if amount < 1:
+            await present_embed(
+                ctx,
+                title="Invalid amount",
+                description="Amount must be at least `1`",
+                level="error",
+                ephemeral=True,
+            )
+            return
+
         if not user:
             user = await User.get(ctx.author.id)
         else:
@@ -113,7 +135,7 @@ class Experience(commands.Cog):
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
         campaign = channel_objects.campaign
 
-        title = f"Add `{amount}` cool {p.plural_noun('point', amount)} to `{user.name}` in `{campaign.name}`"
+        title = f"Add `{amount}` cool {pluralize('point', amount)} to `{user.name}` in `{campaign.name}`"
         description = "View cool points with `/user_info`"
         is_confirmed, msg, confirmation_embed = await confirm_action(
             ctx, title, description=description, hidden=hidden, audit=True
@@ -128,6 +150,7 @@ class Experience(commands.Cog):
         await msg.edit_original_response(embed=confirmation_embed, view=None)
 
     @xp.command(name="spend", description="Spend experience points")
+    @commands.cooldown(XP_COMMAND_RATE, XP_COMMAND_PER, commands.BucketType.user)
     async def xp_spend(
         self,
         ctx: ValentinaContext,
@@ -138,18 +161,17 @@ class Experience(commands.Cog):
             required=True,
             autocomplete=select_char_trait,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default false).",
-            default=False,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_FALSE,
     ) -> None:
         """Spend experience points."""
-        channel_objects = await fetch_channel_object(ctx, need_campaign=True, need_character=True)
+        channel_objects, user = await asyncio.gather(
+            fetch_channel_object(ctx, need_campaign=True, need_character=True),
+            User.get(ctx.author.id),
+        )
         campaign = channel_objects.campaign
         character = channel_objects.character
 
-        trait_controller = TraitModifier(character, await User.get(ctx.author.id))
+        trait_controller = TraitModifier(character, user)
 
         # Guard statement: fail if the trait is already at max value
         if trait.value >= trait.max_value:
@@ -164,7 +186,7 @@ class Experience(commands.Cog):
 
         cost_to_upgrade = trait_controller.cost_to_upgrade(trait)
 
-        title = f"Upgrade `{trait.name}` from `{trait.value}` {p.plural_noun('dot', trait.value)} to `{trait.value + 1}` {p.plural_noun('dot', trait.value + 1)} for `{cost_to_upgrade}` xp"
+        title = f"Upgrade `{trait.name}` from `{trait.value}` {pluralize('dot', trait.value)} to `{trait.value + 1}` {pluralize('dot', trait.value + 1)} for `{cost_to_upgrade}` xp"
         is_confirmed, msg, confirmation_embed = await confirm_action(
             ctx, title, hidden=hidden, audit=True
         )
@@ -1,6 +1,7 @@
 # mypy: disable-error-code="valid-type"
 """Gameplay cog for Valentina."""
 
+import asyncio
 import random
 
 import discord
@@ -22,6 +23,23 @@ from valentina.discord.views import present_embed
 from valentina.models import User
 from valentina.utils import random_num
 
+# Possible (title, description) results for each total damage after soak, from 0 up to 13 or more
+_STUNNED = (("Stunned", "Spend 1 Willpower or lose one turn."),)
+_HEAD_TRAUMA = (("Severe head trauma", "Physical rolls lose 1 die; Mental rolls lose 2."),)
+_LIMB_OR_BLINDED = (
+    ("Broken limb or joint", "Rolls using the affected limb lose 3 dice."),
+    ("Blinded", "Vision-related rolls lose 3 dice."),
+)
+_DAMAGE_RESULTS: tuple[tuple[tuple[str, str], ...], ...] = (
+    (("No Damage", "Miracles happen, no damage taken"),),
+    *(_STUNNED,) * 6,
+    *(_HEAD_TRAUMA,) * 2,
+    *(_LIMB_OR_BLINDED,) * 2,
+    (("Massive wound", "All rolls lose 2 dice. Add 1 to all damage suffered."),),
+    (("Crippled", "Limb is lost or mangled beyond use. Lose 3 dice when using it."),),
+    (("Death or torpor", "Mortals die. Vampires enter immediate torpor."),),
+)
+
 
 class Roll(commands.Cog):
     """Commands used during gameplay."""
@@ -201,11 +219,14 @@ class Roll(commands.Cog):
         comment: Option(str, "A comment to display with the roll", required=False, default=None),
     ) -> None:
         """Roll a macro."""
-        channel_objects = await fetch_channel_object(ctx, need_character=True, need_campaign=True)
+        # Macros are embedded in the user document, so linked characters are not needed
+        channel_objects, user = await asyncio.gather(
+            fetch_channel_object(ctx, need_character=True, need_campaign=True),
+            User.get(ctx.author.id),
+        )
         campaign = channel_objects.campaign
         character = channel_objects.character
 
-        user = await User.get(ctx.author.id, fetch_links=True)
         macro = user.macros[index]
 
         trait_one = await character.fetch_trait_by_name(macro.trait_one)
@@ -312,31 +333,9 @@ class Roll(commands.Cog):
     ) -> None:
         """Determine damage."""
         damage = damage + random_num(10) - soak
+        results = _DAMAGE_RESULTS[max(0, min(damage, len(_DAMAGE_RESULTS) - 1))]
 
-        if damage <= 0:
-            result = ("No Damage", "Miracles happen, no damage taken")
-
-        if 1 <= damage <= 6:  # noqa: PLR2004
-            result = ("Stunned", "Spend 1 Willpower or lose one turn.")
-
-        elif 7 <= damage <= 8:  # noqa: PLR2004
-            result = ("Severe head trauma", "Physical rolls lose 1 die; Mental rolls lose 2.")
-
-        elif 9 <= damage <= 10:  # noqa: PLR2004
-            one = ("Broken limb or joint", "Rolls using the affected limb lose 3 dice.")
-            two = ("Blinded", "Vision-related rolls lose 3 dice.")
-            result = random.choice([one, two])
-
-        elif damage == 11:  # noqa: PLR2004
-            result = ("Massive wound", "All rolls lose 2 dice. Add 1 to all damage suffered.")
-
-        elif damage == 12:  # noqa: PLR2004
-            result = ("Crippled", "Limb is lost or mangled beyond use. Lose 3 dice when using it.")
-
-        elif damage >= 13:  # noqa: PLR2004
-            result = ("Death or torpor", "Mortals die. Vampires enter immediate torpor.")
-
-        title, description = result
+        title, description = random.choice(results)
         await present_embed(ctx, title, description, level="info")
 
 
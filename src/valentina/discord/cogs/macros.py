@@ -6,7 +6,9 @@ from discord.commands import Option
 from discord.ext import commands
 
 from valentina.discord.bot import Valentina, ValentinaContext
+from valentina.discord.utils import HIDDEN_OPTION_DEFAULT_TRUE
 from valentina.discord.utils.autocomplete import (
+    invalidate_macro_options,
     select_char_trait,
     select_char_trait_two,
     select_macro,
@@ -82,6 +84,7 @@ class Macro(commands.Cog):
         )
         user.macros.append(macro)
         await user.save()
+        invalidate_macro_options(user.id)
 
         await ctx.post_to_audit_log(
             f"Create macro: `{name}`(`{trait_one.name}` + `{trait_two.name}`)"
@@ -149,11 +152,7 @@ class Macro(commands.Cog):
             required=True,
             autocomplete=select_macro,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a macro from a user."""
         user = await User.get(ctx.author.id, fetch_links=True)
@@ -169,6 +168,7 @@ class Macro(commands.Cog):
 
         del user.macros[index]
         await user.save()
+        invalidate_macro_options(user.id)
 
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
 
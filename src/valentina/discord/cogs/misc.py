@@ -1,18 +1,21 @@
 # mypy: disable-error-code="valid-type"
 """Miscellaneous commands."""
 
+import asyncio
 import random
 from datetime import UTC, datetime
+from functools import lru_cache
 
 import arrow
 import discord
 import inflect
 import semver
-from discord.commands import Option
+from discord.commands import Option, OptionChoice
 from discord.ext import commands
 
-from valentina.constants import DiceType, EmbedColor, RollResultType
+from valentina.constants import NAME_GENDERS, DiceType, EmbedColor, RollResultType
 from valentina.discord.bot import Valentina, ValentinaContext
+from valentina.discord.utils import HIDDEN_OPTION_DEFAULT_TRUE
 from valentina.discord.utils.autocomplete import (
     select_changelog_version_1,
     select_changelog_version_2,
@@ -24,6 +27,27 @@ from valentina.models import ChangelogParser, Character, Guild, Probability, Sta
 from valentina.utils.helpers import fetch_random_name
 
 p = inflect.engine()
+VERSION_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_version(version: str) -> semver.Version:
+    """Parse a changelog version, caching the result since the same few versions are requested repeatedly.
+
+    Args:
+        version (str): The version string to parse.
+
+    Returns:
+        semver.Version: The parsed version.
+
+    Raises:
+        commands.BadArgument: If the version is not a valid semantic version.
+    """
+    try:
+        return semver.Version.parse(version)
+    except ValueError as e:
+        msg = f"`{version}` is not a valid version"
+        raise commands.BadArgument(msg) from e
 
 
 class Misc(commands.Cog):
@@ -31,6 +55,43 @@ class Misc(commands.Cog):
 
     def __init__(self, bot: Valentina) -> None:
         self.bot: Valentina = bot
+        # Formatted role lists for server_info, keyed on guild id and cleared by role events
+        self._roles_cache: dict[int, str] = {}
+
+    def _format_roles(self, guild: discord.Guild) -> str:
+        """Return the guild's roles, highest first, formatted for server_info.
+
+        Args:
+            guild (discord.Guild): The guild to list roles for.
+
+        Returns:
+            str: A comma separated list of role names.
+        """
+        if (roles := self._roles_cache.get(guild.id)) is None:
+            roles = self._roles_cache[guild.id] = ", ".join(
+                [
+                    f"@{x.name}" if not x.name.startswith("@") else x.name
+                    for x in guild.roles
+                    if not x.is_bot_managed() and not x.is_integration() and not x.is_default()
+                ][::-1]
+            )
+
+        return roles
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        """Clear the cached role list when a role is created."""
+        self._roles_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Clear the cached role list when a role is deleted."""
+        self._roles_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:  # noqa: ARG002
+        """Clear the cached role list when a role is renamed or moved."""
+        self._roles_cache.pop(after.guild.id, None)
 
     @commands.slash_command(name="server_info", description="View information about the server")
     async def server_info(
@@ -48,20 +109,35 @@ class Misc(commands.Cog):
         minutes, _ = divmod(remainder, 60)
         days, hours = divmod(hours, 24)
 
-        # Load db objects
-        guild = await Guild.get(ctx.guild.id, fetch_links=True)
+        # Load db objects concurrently, counting player and storyteller characters in a single query
+        roll_stats = Statistics(ctx)
+        guild, character_counts, guild_roll_stats = await asyncio.gather(
+            Guild.get(ctx.guild.id, fetch_links=True),
+            Character.find(Character.guild == ctx.guild.id)
+            .aggregate(
+                [
+                    {
+                        "$group": {
+                            "_id": None,
+                            "players": {"$sum": {"$cond": ["$type_player", 1, 0]}},
+                            "storytellers": {"$sum": {"$cond": ["$type_storyteller", 1, 0]}},
+                        }
+                    }
+                ]
+            )
+            .to_list(),
+            roll_stats.guild_statistics(
+                as_embed=False,
+                with_title=False,
+                with_help=True,  # type: ignore [arg-type]
+            ),
+        )
 
         # Compute data
         created_on = arrow.get(ctx.guild.created_at)
-        player_characters = await Character.find(
-            Character.guild == ctx.guild.id,
-            Character.type_player == True,  # noqa: E712
-        ).count()
-        storyteller_characters = await Character.find(
-            Character.guild == ctx.guild.id,
-            Character.type_storyteller == True,  # noqa: E712
-        ).count()
-        roll_stats = Statistics(ctx)
+        counts = character_counts[0] if character_counts else {}
+        player_characters = counts.get("players", 0)
+        storyteller_characters = counts.get("storytellers", 0)
 
         # Build the Embed
         embed = discord.Embed(
@@ -74,7 +150,7 @@ class Misc(commands.Cog):
 Created: {created_on.humanize()} ({created_on.format('YYYY-MM-DD')})
 Owner  : {ctx.guild.owner.display_name}
 Members: {ctx.guild.member_count}
-Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for x in ctx.guild.roles if not x.is_bot_managed() and not x.is_integration() and not x.is_default()][::-1])}
+Roles  : {self._format_roles(ctx.guild)}
 ```
 """,
             inline=False,
@@ -108,11 +184,7 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
 
         embed.add_field(
             name="Roll Statistics",
-            value=await roll_stats.guild_statistics(
-                as_embed=False,
-                with_title=False,
-                with_help=True,  # type: ignore [arg-type]
-            ),
+            value=guild_roll_stats,
             inline=False,
         )
         embed.set_footer(
@@ -188,8 +260,17 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
     ) -> None:
         """View information about a user."""
         target = user or ctx.author
-        db_user = await User.get(target.id, fetch_links=True)
-        guild = await Guild.get(ctx.guild.id, fetch_links=True)
+        stats_engine = Statistics(ctx)
+        db_user, guild, user_roll_stats = await asyncio.gather(
+            User.get(target.id, fetch_links=True),
+            Guild.get(ctx.guild.id, fetch_links=True),
+            stats_engine.user_statistics(
+                target,  # type: ignore [arg-type]
+                as_embed=False,
+                with_title=False,
+                with_help=False,
+            ),
+        )
 
         # Variables for embed
         num_characters = len([x for x in db_user.characters if x.type_player])
@@ -203,13 +284,8 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
             )
             or "No roles"
         )
-        stats_engine = Statistics(ctx)
-        user_roll_stats = await stats_engine.user_statistics(
-            target,  # type: ignore [arg-type]
-            as_embed=False,
-            with_title=False,
-            with_help=False,
-        )
+        created_on = arrow.get(target.created_at)
+        joined_on = arrow.get(target.joined_at) if isinstance(target, discord.Member) else None
         lifetime_xp = db_user.lifetime_experience
         lifetime_cp = db_user.lifetime_cool_points
         description = f"""\
@@ -217,8 +293,8 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
 
 ### User Information
 `ID             :` {target.id}
-`Account Created:` {arrow.get(target.created_at).humanize()} `({arrow.get(target.created_at).format('YYYY-MM-DD')})`
-`Joined Server  :` {arrow.get(target.joined_at).humanize() if isinstance(target, discord.Member) else ''} `({arrow.get(target.joined_at).format('YYYY-MM-DD') if isinstance(target, discord.Member) else ''})`
+`Account Created:` {created_on.humanize()} `({created_on.format("YYYY-MM-DD")})`
+`Joined Server  :` {joined_on.humanize() if joined_on else ""} `({joined_on.format("YYYY-MM-DD") if joined_on else ""})`
 `Roles          :` {roles}
 
 ### Gameplay
@@ -274,7 +350,7 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
         ),
     ) -> None:
         """Post the changelog."""
-        if semver.compare(oldest_version, newest_version) > 0:
+        if _parse_version(oldest_version) > _parse_version(newest_version):
             msg = (
                 f"Oldest version `{oldest_version}` is newer than newest version `{newest_version}`"
             )
@@ -305,7 +381,7 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
             str,
             name="gender",
             description="The character's gender",
-            choices=["male", "female"],
+            choices=NAME_GENDERS,
             required=True,
         ),
         country: Option(
@@ -320,15 +396,16 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
         ),
     ) -> None:
         """Generate a random name."""
-        name_list = [
-            f"- {name[0].title()} {name[1].title()}\n"
-            for name in await fetch_random_name(gender=gender, country=country, results=number)
-        ]
+        names = await fetch_random_name(gender=gender, country=country, results=number)
+        # A single result is returned as a bare (first, last) tuple
+        if isinstance(names, tuple):
+            names = [names]
+        name_list = "".join(f"- {first.title()} {last.title()}\n" for first, last in names)
 
         await ctx.respond(
             embed=discord.Embed(
                 title="Random Name Generator",
-                description=f"Here are some random names for you, {ctx.author.mention}!\n{''.join(name_list)}",
+                description=f"Here are some random names for you, {ctx.author.mention}!\n{name_list}",
                 color=EmbedColor.INFO.value,
             ),
             ephemeral=True,
@@ -344,17 +421,14 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
             str,
             description="Type of roll to add the image to",
             required=True,
-            choices=[roll_type.name.title() for roll_type in RollResultType],
+            choices=[OptionChoice(x.name.title(), x.name) for x in RollResultType],
         ),
         url: Option(ValidImageURL, description="URL to the image", required=True),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add a roll result thumbnail to the bot."""
-        title = f"Add roll result image for {roll_type.title()}\n{url}"
+        result_type = RollResultType[roll_type]
+        title = f"Add roll result image for {result_type.name.title()}\n{url}"
         is_confirmed, interaction, confirmation_embed = await confirm_action(
             ctx, title, hidden=hidden, image=url, audit=True
         )
@@ -363,7 +437,7 @@ Roles  : {', '.join([f'@{x.name}' if not x.name.startswith('@') else x.name for
             return
 
         guild = await Guild.get(ctx.guild.id, fetch_links=True)
-        await guild.add_roll_result_thumbnail(ctx, RollResultType[roll_type.upper()], url)
+        await guild.add_roll_result_thumbnail(ctx, result_type, url)
 
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
 
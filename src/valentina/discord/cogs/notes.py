@@ -1,6 +1,8 @@
 # mypy: disable-error-code="valid-type"
 """Cog for adding notes to campaigns, books, and characters."""
 
+import asyncio
+from operator import attrgetter
 from typing import Annotated
 
 import discord
@@ -52,8 +54,9 @@ class Note(commands.Cog):
             )
             return
 
+        note_text = note.strip().capitalize()
         title = f"Add note to `{channel_object.name}`"
-        description = f"```\n{note.strip().capitalize()}\n```"
+        description = f"```\n{note_text}\n```"
         is_confirmed, interaction, confirmation_embed = await confirm_action(
             ctx, title, description=description, hidden=hidden, audit=True
         )
@@ -61,12 +64,12 @@ class Note(commands.Cog):
         if not is_confirmed:
             return
 
-        note = await DbNote(
+        db_note = await DbNote(
             created_by=ctx.author.id,
-            text=note.strip().capitalize(),
+            text=note_text,
             parent_id=str(channel_object.id),
         ).insert()
-        channel_object.notes.append(note)
+        channel_object.notes.append(db_note)
         await channel_object.save()
 
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
@@ -98,8 +101,8 @@ class Note(commands.Cog):
             )
             return
 
-        sorted_notes = sorted(channel_object.notes, key=lambda x: x.date_created)  # type: ignore [attr-defined]
-        notes = [await x.display(ctx) for x in sorted_notes]  # type: ignore [attr-defined]
+        sorted_notes = sorted(channel_object.notes, key=attrgetter("date_created"))  # type: ignore [attr-defined]
+        notes = [x.display(ctx) for x in sorted_notes]  # type: ignore [attr-defined]
 
         await auto_paginate(
             ctx=ctx,
@@ -199,10 +202,14 @@ class Note(commands.Cog):
         if not is_confirmed:
             return
 
-        channel_object.remove(note_to_delete)
-        await channel_object.save()
+        channel_object.notes = [
+            x
+            for x in channel_object.notes
+            if x.id != note_to_delete.id  # type: ignore [attr-defined]
+        ]
 
-        await note_to_delete.delete()
+        # Unlinking the note and deleting it are independent writes
+        await asyncio.gather(channel_object.save(), note_to_delete.delete())
 
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
 
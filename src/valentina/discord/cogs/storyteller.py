@@ -11,15 +11,21 @@ from loguru import logger
 
 from valentina.constants import (
     DEFAULT_DIFFICULTY,
+    NAME_GENDERS,
     VALID_IMAGE_EXTENSIONS,
     CharClass,
     DiceType,
     EmbedColor,
 )
-from valentina.controllers import ChannelManager, RNGCharGen, delete_character
+from valentina.controllers import (
+    ChannelManager,
+    RNGCharGen,
+    delete_character,
+    discard_draft_character,
+)
 from valentina.discord.bot import Valentina, ValentinaContext
 from valentina.discord.characters import AddFromSheetWizard
-from valentina.discord.utils import fetch_channel_object
+from valentina.discord.utils import HIDDEN_OPTION_DEFAULT_TRUE, fetch_channel_object
 from valentina.discord.utils.autocomplete import (
     select_any_player_character,
     select_char_class,
@@ -53,7 +59,7 @@ from valentina.discord.views import (
     sheet_embed,
     show_sheet,
 )
-from valentina.models import AWSService, Character, CharacterTrait, User
+from valentina.models import AWSService, Character, CharacterListing, CharacterTrait, User
 from valentina.utils.helpers import (
     fetch_data_from_url,
 )
@@ -150,7 +156,7 @@ class StoryTeller(commands.Cog):
     ) -> None:
         """Create a new storyteller character using the add from sheet wizard."""
         # Require a clan for vampires
-        if char_class == CharClass.VAMPIRE and not vampire_clan:
+        if char_class is CharClass.VAMPIRE and not vampire_clan:
             await present_embed(
                 ctx,
                 title="Vampire clan required",
@@ -183,6 +189,7 @@ class StoryTeller(commands.Cog):
         logger.info(f"CHARACTER: Create storyteller character {character.name}")
 
     @character.command(name="create_rng", description="Create a random new npc character")
+    @commands.max_concurrency(1, per=commands.BucketType.user, wait=False)
     async def create_rng_char(
         self,
         ctx: ValentinaContext,
@@ -190,7 +197,7 @@ class StoryTeller(commands.Cog):
             str,
             name="gender",
             description="The character's gender",
-            choices=["male", "female"],
+            choices=NAME_GENDERS,
             required=True,
         ),
         character_class: Option(
@@ -267,7 +274,7 @@ class StoryTeller(commands.Cog):
 
         await view.wait()
         if not view.confirmed:
-            await delete_character(character)
+            await discard_draft_character(character)
 
             await msg.edit_original_response(  # type: ignore [union-attr]
                 embed=discord.Embed(
@@ -291,10 +298,15 @@ class StoryTeller(commands.Cog):
         ctx: ValentinaContext,
     ) -> None:
         """List all storyteller characters."""
-        all_characters = await Character.find_many(
-            Character.guild == ctx.guild.id,
-            Character.type_storyteller == True,  # noqa: E712
-        ).to_list()
+        all_characters = (
+            await Character.find_many(
+                Character.guild == ctx.guild.id,
+                Character.type_storyteller == True,  # noqa: E712
+            )
+            .sort(+Character.name_first, +Character.name_last)
+            .project(CharacterListing)
+            .to_list()
+        )
 
         if len(all_characters) == 0:
             await present_embed(
@@ -310,7 +322,7 @@ class StoryTeller(commands.Cog):
 
         characters = [
             f"{i}. **{x.full_name}** [{x.char_class_name.title()}]"
-            for i, x in enumerate(sorted(all_characters, key=lambda x: x.name))
+            for i, x in enumerate(all_characters)
         ]
 
         await auto_paginate(ctx=ctx, title=title, text="\n".join(characters))
@@ -334,11 +346,7 @@ class StoryTeller(commands.Cog):
         new_value: Option(
             int, description="New value for the trait", required=True, min_value=0, max_value=20
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update the value of a trait for a storyteller or player character."""
         if new_value > trait.max_value:
@@ -396,11 +404,7 @@ class StoryTeller(commands.Cog):
             autocomplete=select_storyteller_character,
             required=True,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Delete a storyteller character."""
         title = f"Delete storyteller character `{character.full_name}`"
@@ -441,11 +445,7 @@ class StoryTeller(commands.Cog):
             max_value=20,
             default=5,
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Add a custom trait to a character."""
         title = f"Create custom trait: `{name.title()}` at `{value}` dots for {character.full_name}"
@@ -594,11 +594,7 @@ class StoryTeller(commands.Cog):
             required=True,
         ),
         new_user: Option(discord.User, description="The user to transfer the character to"),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update the value of a trait for a storyteller or player character."""
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
@@ -656,11 +652,7 @@ class StoryTeller(commands.Cog):
         new_value: Option(
             int, description="New value for the trait", required=True, min_value=0, max_value=20
         ),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Update the value of a trait for a storyteller or player character."""
         if not 0 <= new_value <= trait.max_value:
@@ -719,11 +711,7 @@ class StoryTeller(commands.Cog):
             default=DEFAULT_DIFFICULTY,
         ),
         comment: Option(str, "A comment to display with the roll", required=False, default=None),
-        hidden: Option(
-            bool,
-            description="Make the response visible only to you (default true).",
-            default=True,
-        ),
+        hidden: HIDDEN_OPTION_DEFAULT_TRUE,
     ) -> None:
         """Roll traits for a storyteller character."""
         channel_objects = await fetch_channel_object(ctx, need_campaign=True)
@@ -8,8 +8,11 @@ from .discord_utils import (
     get_user_from_id,
     set_channel_perms,
 )
+from .options import HIDDEN_OPTION_DEFAULT_FALSE, HIDDEN_OPTION_DEFAULT_TRUE
 
 __all__ = [
+    "HIDDEN_OPTION_DEFAULT_FALSE",
+    "HIDDEN_OPTION_DEFAULT_TRUE",
     "assert_permissions",
     "create_player_role",
     "create_storyteller_role",
@@ -1,6 +1,8 @@
 """Reusable autocomplete options for cogs and commands."""
 
-from typing import cast
+import time
+from bisect import bisect_left
+from functools import cache
 
 import discord
 import inflect
@@ -16,13 +18,94 @@ from valentina.constants import (
     TraitCategory,
     VampireClan,
 )
-from valentina.discord.bot import Valentina
 from valentina.discord.utils import fetch_channel_object
 from valentina.models import AWSService, Campaign, ChangelogParser, Character, User
 from valentina.utils import errors
-from valentina.utils.helpers import truncate_string
+from valentina.utils.helpers import trait_option_cache, truncate_string
 
 MAX_OPTION_LENGTH = 99
+TRAIT_OPTION_CACHE_TTL = 60  # seconds
+TRAIT_OPTION_CACHE_SIZE = 2048
+MACRO_OPTION_CACHE_TTL = 60  # seconds
+MACRO_OPTION_CACHE_SIZE = 2048
+
+
+# Macro (label, index, lowercased abbreviation) tuples for each user, keyed on the user id, with their expiry time
+_macro_option_cache: dict[int, tuple[float, list[tuple[str, int, str]]]] = {}
+
+
+def invalidate_macro_options(user_id: int) -> None:
+    """Drop the cached macro autocomplete options for a user.
+
+    Macro options are selected by their index in the user's macro list, so call this whenever a user's macros are created, edited, or deleted to keep cached indexes from pointing at the wrong macro.
+
+    Args:
+        user_id (int): The id of the user whose macros changed.
+    """
+    _macro_option_cache.pop(user_id, None)
+
+
+async def _fetch_trait_options(
+    ctx: discord.AutocompleteContext,
+) -> tuple[list[str], list[tuple[str, str]]] | None:
+    """Fetch the sorted trait names and ids for the character associated with the channel.
+
+    Autocomplete fires on every keystroke, so the candidate list is cached for a short time per channel and only filtered in Python on subsequent keystrokes.
+
+    Args:
+        ctx (discord.AutocompleteContext): The context in which the function is called.
+
+    Returns:
+        tuple[list[str], list[tuple[str, str]]] | None: The lowercased trait names and the matching trait names and ids, both sorted case-insensitively, or None if the channel is not a character channel.
+    """
+    key = (ctx.interaction.guild.id, ctx.interaction.channel.id)
+    now = time.monotonic()
+
+    if (cached := trait_option_cache.get(key)) and cached[0] > now:
+        return cached[1], cached[2]
+
+    channel_objects = await fetch_channel_object(ctx, raise_error=False)
+    character = channel_objects.character
+
+    if not character:
+        return None
+
+    options = sorted(
+        ((t.name, str(t.id)) for t in character.traits),  # type: ignore [attr-defined]
+        key=lambda option: option[0].lower(),
+    )
+    names = [name.lower() for name, _ in options]
+
+    if len(trait_option_cache) >= TRAIT_OPTION_CACHE_SIZE:
+        trait_option_cache.clear()
+    trait_option_cache[key] = (now + TRAIT_OPTION_CACHE_TTL, names, options)
+
+    return names, options
+
+
+def _match_trait_options(
+    names: list[str], options: list[tuple[str, str]], argument: str
+) -> list[OptionChoice]:
+    """Return the trait options whose names start with the argument.
+
+    Locate the first match by bisecting the sorted lowercased names and take consecutive matches from there, rather than testing every trait on each keystroke.
+
+    Args:
+        names (list[str]): The lowercased trait names in sorted order.
+        options (list[tuple[str, str]]): The (name, id) pairs in the same order as names.
+        argument (str): The text typed by the user.
+
+    Returns:
+        list[OptionChoice]: Up to MAX_OPTION_LIST_SIZE matching options.
+    """
+    argument = argument.lower()
+    choices = []
+    for i in range(bisect_left(names, argument), len(names)):
+        if not names[i].startswith(argument) or len(choices) >= MAX_OPTION_LIST_SIZE:
+            break
+        choices.append(OptionChoice(*options[i]))
+
+    return choices
 
 
 ################## Character Autocomplete Functions ##################
@@ -257,6 +340,12 @@ async def select_aws_object_from_guild(
     ]
 
 
+@cache
+def _changelog_versions() -> tuple[str, ...]:
+    """Return the changelog versions, newest first, parsing the changelog once per process since it only changes between deploys."""
+    return tuple(ChangelogParser().list_of_versions())
+
+
 async def select_changelog_version_1(
     ctx: discord.AutocompleteContext,
 ) -> list[str]:  # pragma: no cover
@@ -270,10 +359,7 @@ async def select_changelog_version_1(
     Returns:
         A list of version strings matching the user's input, limited to MAX_OPTION_LIST_SIZE.
     """
-    bot = cast(Valentina, ctx.bot)
-    possible_versions = ChangelogParser(bot).list_of_versions()
-
-    return [version for version in possible_versions if version.startswith(ctx.value)][
+    return [version for version in _changelog_versions() if version.startswith(ctx.value)][
         :MAX_OPTION_LIST_SIZE
     ]
 
@@ -291,10 +377,7 @@ async def select_changelog_version_2(
     Returns:
         A list of version strings matching the user's input, limited to MAX_OPTION_LIST_SIZE.
     """
-    bot = cast(Valentina, ctx.bot)
-    possible_versions = ChangelogParser(bot).list_of_versions()
-
-    return [version for version in possible_versions if version.startswith(ctx.value)][
+    return [version for version in _changelog_versions() if version.startswith(ctx.value)][
         :MAX_OPTION_LIST_SIZE
     ]
 
@@ -346,13 +429,14 @@ async def select_campaign(ctx: discord.AutocompleteContext) -> list[OptionChoice
         list[OptionChoice]: A list of OptionChoice objects representing available campaigns.
             Each option contains the campaign name as the label and the campaign's database ID as the value.
     """
-    all_campaigns = sorted(
+    # Only the name and id are displayed, so skip fetching linked documents and sort in the database
+    all_campaigns = (
         await Campaign.find(
             Campaign.guild == ctx.interaction.guild.id,
             Campaign.is_deleted == False,  # noqa: E712
-            fetch_links=True,
-        ).to_list(),
-        key=lambda x: x.name,
+        )
+        .sort(+Campaign.name)
+        .to_list()
     )
 
     options = [
@@ -391,7 +475,7 @@ async def select_chapter(ctx: discord.AutocompleteContext) -> list[OptionChoice]
 
     choices = [
         OptionChoice(f"{chapter.number}. {chapter.name}", str(chapter.id))
-        for chapter in sorted(await book.fetch_chapters(), key=lambda x: x.number)
+        for chapter in await book.fetch_chapters()
         if chapter.name.lower().startswith(ctx.options["chapter"].lower())
     ][:MAX_OPTION_LIST_SIZE]
 
@@ -459,13 +543,13 @@ async def select_char_inventory_item(ctx: discord.AutocompleteContext) -> list[O
         return [OptionChoice("Rerun command in a character channel", "")]
 
     # Determine the option to retrieve the argument
-    argument = ctx.options.get("item") or ""
+    argument = (ctx.options.get("item") or "").lower()
 
     # Filter and return the character's inventory items
     return [
         OptionChoice(t.name, str(t.id))  # type: ignore [attr-defined]
         for t in sorted(character.inventory, key=lambda x: x.name)  # type: ignore [attr-defined]
-        if t.name.lower().startswith(argument.lower())  # type: ignore [attr-defined]
+        if t.name.lower().startswith(argument)  # type: ignore [attr-defined]
     ][:MAX_OPTION_LIST_SIZE]
 
 
@@ -503,21 +587,16 @@ async def select_char_trait(ctx: discord.AutocompleteContext) -> list[OptionChoi
     Returns:
         list[OptionChoice]: A list of available names and their index in character.traits.
     """
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    character = channel_objects.character
+    trait_options = await _fetch_trait_options(ctx)
 
-    if not character:
+    if trait_options is None:
         return [OptionChoice("Rerun command in a character channel", "")]
 
     # Determine the option to retrieve the argument
     argument = ctx.options.get("trait") or ctx.options.get("trait_one") or ""
 
     # Filter and return the character's traits
-    return [
-        OptionChoice(t.name, str(t.id))  # type: ignore [attr-defined]
-        for t in sorted(character.traits, key=lambda x: x.name)  # type: ignore [attr-defined]
-        if t.name.lower().startswith(argument.lower())  # type: ignore [attr-defined]
-    ][:MAX_OPTION_LIST_SIZE]
+    return _match_trait_options(*trait_options, argument)
 
 
 async def select_char_trait_two(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
@@ -534,18 +613,13 @@ async def select_char_trait_two(ctx: discord.AutocompleteContext) -> list[Option
     Returns:
         list[OptionChoice]: A list of available trait names and their index in character.traits.
     """
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    character = channel_objects.character
+    trait_options = await _fetch_trait_options(ctx)
 
-    if not character:
+    if trait_options is None:
         return [OptionChoice("Rerun command in a character channel", "")]
 
     # Filter and return the character's traits
-    return [
-        OptionChoice(t.name, str(t.id))  # type: ignore [attr-defined]
-        for t in sorted(character.traits, key=lambda x: x.name)  # type: ignore [attr-defined]
-        if t.name.lower().startswith(ctx.options["trait_two"].lower())  # type: ignore [attr-defined]
-    ][:MAX_OPTION_LIST_SIZE]
+    return _match_trait_options(*trait_options, ctx.options["trait_two"])
 
 
 async def select_custom_section(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
@@ -650,15 +724,29 @@ async def select_macro(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
     Returns:
         list[OptionChoice]: A list of OptionChoice objects to populate the select list.
     """
-    user_object = await User.get(ctx.interaction.user.id)
-
-    macros = [(macro, index) for index, macro in enumerate(user_object.macros)]
+    user_id = ctx.interaction.user.id
+    now = time.monotonic()
+
+    # Autocomplete fires on every keystroke, so cache the user's macros for a short time
+    if (cached := _macro_option_cache.get(user_id)) and cached[0] > now:
+        macros = cached[1]
+    else:
+        user_object = await User.get(user_id)
+        macros = [
+            (f"{macro.abbreviation} ({macro.name})", index, macro.abbreviation.lower())
+            for index, macro in enumerate(user_object.macros)
+        ]
+
+        if len(_macro_option_cache) >= MACRO_OPTION_CACHE_SIZE:
+            _macro_option_cache.clear()
+        _macro_option_cache[user_id] = (now + MACRO_OPTION_CACHE_TTL, macros)
 
     # Create OptionChoice objects
+    argument = ctx.options["macro"].lower()
     options = [
-        OptionChoice(f"{macro.abbreviation} ({macro.name})", index)
-        for macro, index in macros
-        if macro.abbreviation.lower().startswith(ctx.options["macro"].lower())
+        OptionChoice(label, index)
+        for label, index, abbreviation in macros
+        if abbreviation.startswith(argument)
     ]
 
     # Check if the number of options exceeds the maximum allowed
@@ -729,8 +817,8 @@ async def select_trait_from_char_option(ctx: discord.AutocompleteContext) -> lis
     Returns:
         list[str]: A list of trait names for the autocomplete list.
     """
-    # Determine the argument based on the Discord option
-    argument = ctx.options.get("trait") or ctx.options.get("trait_one") or ""
+    # Determine the argument based on the Discord option, lowercased once rather than for every trait
+    argument = (ctx.options.get("trait") or ctx.options.get("trait_one") or "").lower()
 
     # Fetch the character from the ctx options
     character = await Character.get(ctx.options["character"], fetch_links=True)
@@ -743,7 +831,7 @@ async def select_trait_from_char_option(ctx: discord.AutocompleteContext) -> lis
     options = [
         OptionChoice(t.name, str(t.id))
         for t in character.traits
-        if t.name.lower().startswith(argument.lower())
+        if t.name.lower().startswith(argument)
     ][:MAX_OPTION_LIST_SIZE]
 
     return options or [OptionChoice("No traits", "")]
@@ -763,12 +851,15 @@ async def select_trait_from_char_option_two(ctx: discord.AutocompleteContext) ->
     # Fetch the character from the ctx options
     character = await Character.get(ctx.options["character"], fetch_links=True)
 
+    # Lowercase the argument once rather than for every trait
+    argument = ctx.options["trait_two"].lower()
+
     # Fetch and filter traits
     # Filter and return the character's traits
     options = [
         OptionChoice(t.name, str(t.id))
         for t in character.traits
-        if t.name.lower().startswith(ctx.options["trait_two"].lower())
+        if t.name.lower().startswith(argument)
     ][:MAX_OPTION_LIST_SIZE]
 
     return options or [OptionChoice("No traits", "")]
@@ -89,7 +89,7 @@ class ValidCampaignBook(Converter):  # pragma: no cover
 class ValidCampaignBookChapter(Converter):  # pragma: no cover
     """Convert a chapter ID to a CampaignBookChapter object."""
 
-    async def convert(self, ctx: commands.Context, argument: str) -> CampaignBookChapter:  # noqa: ARG002
+    async def convert(self, ctx: commands.Context, argument: str) -> CampaignBookChapter:
         """Convert a chapter ID to a CampaignBookChapter object.
 
         Args:
@@ -102,6 +102,13 @@ class ValidCampaignBookChapter(Converter):  # pragma: no cover
         Raises:
             BadArgument: If no chapter is found with the given ID.
         """
+        # Chapter commands run in book channels whose chapters are loaded with the channel objects
+        channel_objects = await fetch_channel_object(ctx, raise_error=False)
+        if channel_objects.book:
+            for chapter in channel_objects.book.chapters:
+                if isinstance(chapter, CampaignBookChapter) and str(chapter.id) == argument:
+                    return chapter
+
         chapter = await CampaignBookChapter.get(argument)
         if chapter:
             return chapter
@@ -358,8 +365,15 @@ class ValidImageURL(Converter):  # pragma: no cover
 class ValidNote(Converter):  # pragma: no cover
     """A converter that returns a Note object from the database.from it's id."""
 
-    async def convert(self, ctx: commands.Context, argument: str) -> Note:  # noqa: ARG002
+    async def convert(self, ctx: commands.Context, argument: str) -> Note:
         """Return a note object from a note id."""
+        # Notes belong to the channel's book or character, which are loaded with the channel objects
+        channel_objects = await fetch_channel_object(ctx, raise_error=False)
+        if channel_object := channel_objects.book or channel_objects.character:
+            for note in channel_object.notes:
+                if isinstance(note, Note) and str(note.id) == argument:
+                    return note
+
         note = await Note.get(argument)
         if note:
             return note
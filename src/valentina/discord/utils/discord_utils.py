@@ -1,5 +1,6 @@
 """Helper utilities for working with the discord API."""
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import discord
@@ -221,7 +222,7 @@ async def fetch_channel_object(
 ) -> ChannelObjects:  # pragma: no cover
     """Determine the channel type and fetch associated objects.
 
-    Identify the channel type and fetch related campaign, book, and character objects. Raise errors if specified conditions are not met.
+    Identify the channel type and fetch related campaign, book, and character objects. Raise errors if specified conditions are not met. The fetched objects are cached on the command context so that converters and the command handler share a single set of database lookups for the duration of an interaction.
 
     Args:
         ctx (discord.ApplicationContext | discord.AutocompleteContext | commands.Context): The context containing the channel object.
@@ -236,17 +237,41 @@ async def fetch_channel_object(
     Raises:
         errors.ChannelTypeError: If the required objects are not found based on the specified conditions.
     """
-    discord_channel = (
-        ctx.interaction.channel if isinstance(ctx, discord.AutocompleteContext) else ctx.channel
-    )
+    is_autocomplete = isinstance(ctx, discord.AutocompleteContext)
+    discord_channel = ctx.interaction.channel if is_autocomplete else ctx.channel
+
+    # Autocomplete contexts use __slots__ and live for a single keystroke, so only cache on command contexts
+    channel_objects = None if is_autocomplete else getattr(ctx, "_channel_objects", None)
+
+    if not isinstance(channel_objects, ChannelObjects):
+        channel_category = discord_channel.category
+
+        # The lookups are independent, so run them concurrently
+        campaign, book, character = await asyncio.gather(
+            Campaign.find_one(
+                Campaign.channel_campaign_category == channel_category.id, fetch_links=True
+            ),
+            CampaignBook.find_one(CampaignBook.channel == discord_channel.id, fetch_links=True),
+            Character.find_one(Character.channel == discord_channel.id, fetch_links=True),
+        )
 
-    channel_category = discord_channel.category
+        is_storyteller_channel = (
+            discord_channel and discord_channel.name == CampaignChannelName.STORYTELLER.value
+        )
 
-    campaign = await Campaign.find_one(
-        Campaign.channel_campaign_category == channel_category.id, fetch_links=True
-    )
-    book = await CampaignBook.find_one(CampaignBook.channel == discord_channel.id, fetch_links=True)
-    character = await Character.find_one(Character.channel == discord_channel.id, fetch_links=True)
+        channel_objects = ChannelObjects(
+            campaign=campaign,
+            book=book,
+            character=character,
+            is_storyteller_channel=is_storyteller_channel,
+        )
+
+        if not is_autocomplete:
+            ctx._channel_objects = channel_objects  # type: ignore [union-attr] # noqa: SLF001
+
+    campaign = channel_objects.campaign
+    book = channel_objects.book
+    character = channel_objects.character
 
     if raise_error and need_character and not character:
         msg = "Rerun command in a character channel."
@@ -263,16 +288,7 @@ async def fetch_channel_object(
     if raise_error and not campaign and not book and not character:
         raise errors.ChannelTypeError
 
-    is_storyteller_channel = (
-        discord_channel and discord_channel.name == CampaignChannelName.STORYTELLER.value
-    )
-
-    return ChannelObjects(
-        campaign=campaign,
-        book=book,
-        character=character,
-        is_storyteller_channel=is_storyteller_channel,
-    )
+    return channel_objects
 
 
 def get_user_from_id(
@@ -287,4 +303,4 @@ def get_user_from_id(
     Returns:
         discord.Member | None: The user with the given ID, or None if it is not found.
     """
-    return discord.utils.get(guild.members, id=user_id)
+    return guild.get_member(user_id)
@@ -0,0 +1,15 @@
+"""Slash command options shared across cogs."""
+
+from discord.commands import Option
+
+# Shared `hidden` options so each command does not build its own identical Option
+HIDDEN_OPTION_DEFAULT_TRUE = Option(
+    bool,
+    description="Make the response visible only to you (default true).",
+    default=True,
+)
+HIDDEN_OPTION_DEFAULT_FALSE = Option(
+    bool,
+    description="Make the response visible only to you (default false).",
+    default=False,
+)
@@ -1,13 +1,72 @@
 """Perform a diceroll."""
 
+from typing import Any
+
 import discord
 
-from valentina.constants import EmbedColor, Emoji
+from valentina.constants import DiceType, EmbedColor, Emoji
 from valentina.discord.bot import ValentinaContext
 from valentina.discord.views import ReRollButton, RollDisplay
 from valentina.models import Campaign, Character, CharacterTrait, DiceRoll
 
 
+async def _edit_roll_message(  # pragma: no cover
+    message: discord.Interaction | discord.WebhookMessage, **kwargs: Any
+) -> None:
+    """Edit the roll message, which is either the original interaction response or a followup message.
+
+    Args:
+        message (discord.Interaction | discord.WebhookMessage): The roll message.
+        **kwargs: The fields to edit, such as `embed` and `view`.
+    """
+    if isinstance(message, discord.Interaction):
+        await message.edit_original_response(**kwargs)
+    else:
+        await message.edit(**kwargs)
+
+
+async def _resolve_roll_view(  # pragma: no cover
+    view: ReRollButton,
+    original_response: discord.Interaction | discord.WebhookMessage,
+    campaign: Campaign,
+) -> None:
+    """Update the roll message once the user has responded to the roll buttons or the view timed out.
+
+    Args:
+        view (ReRollButton): The view attached to the roll message.
+        original_response (discord.Interaction | discord.WebhookMessage): The roll message.
+        campaign (Campaign): The campaign the roll belongs to.
+    """
+    if view.overreach:
+        if campaign.danger < 5:  # noqa: PLR2004
+            campaign.danger += 1
+            await campaign.save()
+
+        await _edit_roll_message(
+            original_response,
+            view=None,
+            embed=discord.Embed(
+                title=None,
+                description=f"# {Emoji.OVERREACH.value} Overreach!\nThe character overreached. This roll has succeeded but the danger level has increased to `{campaign.danger}`.",
+                color=EmbedColor.WARNING.value,
+            ),
+        )
+
+    if view.despair:
+        await _edit_roll_message(
+            original_response,
+            view=None,
+            embed=discord.Embed(
+                title=None,
+                description=f"# {Emoji.DESPAIR.value} Despair!\n### This roll has failed and the character has entered Despair!\nYou can no longer use desperation dice until you redeem yourself.",
+                color=EmbedColor.WARNING.value,
+            ),
+        )
+
+    if view.timeout:
+        await _edit_roll_message(original_response, view=None)
+
+
 async def perform_roll(  # pragma: no cover
     ctx: ValentinaContext,
     pool: int,
@@ -37,83 +96,63 @@ async def perform_roll(  # pragma: no cover
         character (Character, optional): The ID of the character to log the roll for. Defaults to None.
         desperation_pool (int, optional): The number of dice in the desperation pool. Defaults to 0.
     """
-    roll = DiceRoll(
-        ctx=ctx,
-        pool=pool,
-        difficulty=difficulty,
-        dice_size=dice_size,
-        character=character,
-        desperation_pool=desperation_pool,
-        campaign=campaign,
-    )
-
     traits_to_log = []
     if trait_one:
         traits_to_log.append(trait_one.name)
     if trait_two:
         traits_to_log.append(trait_two.name)
 
-    await roll.log_roll(traits=traits_to_log)
-
-    view = ReRollButton(
-        author=ctx.author,
-        desperation_pool=desperation_pool,
-        desperation_botch=roll.desperation_botches > 0 if roll.desperation_botches else False,
-    )
-    embed = await RollDisplay(
-        ctx,
-        roll,
-        comment,
-        trait_one,
-        trait_two,
-        desperation_pool=desperation_pool,
-    ).get_embed()
-    original_response = await ctx.respond(embed=embed, view=view, ephemeral=hidden)
-
-    # Wait for a re-roll
-    await view.wait()
-
-    if view.overreach:
-        if campaign.danger < 5:  # noqa: PLR2004
-            campaign.danger += 1
-            await campaign.save()
-
-        await original_response.edit_original_response(  # type: ignore [union-attr]
-            view=None,
-            embed=discord.Embed(
-                title=None,
-                description=f"# {Emoji.OVERREACH.value} Overreach!\nThe character overreached. This roll has succeeded but the danger level has increased to `{campaign.danger}`.",
-                color=EmbedColor.WARNING.value,
-            ),
-        )
-
-    if view.despair:
-        await original_response.edit_original_response(  # type: ignore [union-attr]
-            view=None,
-            embed=discord.Embed(
-                title=None,
-                description=f"# {Emoji.DESPAIR.value} Despair!\n### This roll has failed and the character has entered Despair!\nYou can no longer use desperation dice until you redeem yourself.",
-                color=EmbedColor.WARNING.value,
-            ),
-        )
+    # Re-rolls use the same pool, difficulty, and traits, so a single display is reused for every roll
+    roll_display: RollDisplay | None = None
+    # Re-rolls edit the original message in place rather than sending a new message for each roll
+    original_response: discord.Interaction | discord.WebhookMessage | None = None
+    author = ctx.author
+    # Only d10 rolls are recorded for statistics
+    should_log = dice_size == DiceType.D10.value
 
-    if view.timeout:
-        if isinstance(original_response, discord.Interaction):
-            await original_response.edit_original_response(view=None)
-        if isinstance(original_response, discord.WebhookMessage):
-            await original_response.edit(view=None)
-
-    if view.reroll:
-        await perform_roll(
-            ctx,
+    while True:
+        roll = DiceRoll(
+            ctx=ctx,
             pool=pool,
             difficulty=difficulty,
             dice_size=dice_size,
-            campaign=campaign,
-            comment=comment,
-            hidden=hidden,
-            trait_one=trait_one,
-            trait_two=trait_two,
             character=character,
             desperation_pool=desperation_pool,
+            campaign=campaign,
+        )
+
+        view = ReRollButton(
+            author=author,
+            desperation_pool=desperation_pool,
+            desperation_botch=roll.desperation_botches > 0 if roll.desperation_botches else False,
         )
+
+        if roll_display is None:
+            roll_display = RollDisplay(
+                ctx,
+                roll,
+                comment,
+                trait_one,
+                trait_two,
+                desperation_pool=desperation_pool,
+            )
+        else:
+            roll_display.roll = roll
+
+        embed = await roll_display.get_embed()
+        if original_response is None:
+            original_response = await ctx.respond(embed=embed, view=view, ephemeral=hidden)
+        else:
+            await _edit_roll_message(original_response, embed=embed, view=view)
+
+        # Log the roll once the result has been sent so the write does not delay the response
+        if should_log:
+            await roll.log_roll(traits=traits_to_log)
+
+        # Wait for a re-roll
+        await view.wait()
+
+        await _resolve_roll_view(view, original_response, campaign)
+
+        if not view.reroll:
+            break
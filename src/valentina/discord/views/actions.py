@@ -6,6 +6,41 @@ from valentina.constants import EmbedColor, Emoji, LogLevel
 from valentina.discord.bot import ValentinaContext
 from valentina.discord.views import ConfirmCancelButtons, present_embed
 
+_SUCCESS_COLOR = EmbedColor.SUCCESS.value
+_CANCEL_COLOR = EmbedColor.WARNING.value
+
+
+def _success_embed(
+    title: str,
+    description: str | None = None,
+    image: str | None = None,
+    thumbnail: str | None = None,
+    footer: str | None = None,
+) -> discord.Embed:
+    """Build the embed used to replace a confirmation prompt once the action is confirmed.
+
+    Args:
+        title (str): The title for the embed.
+        description (str, optional): The description for the embed. Defaults to None.
+        image (str, optional): The image URL for the embed. Defaults to None.
+        thumbnail (str, optional): The thumbnail URL for the embed. Defaults to None.
+        footer (str, optional): The footer text for the embed. Defaults to None.
+
+    Returns:
+        discord.Embed: The success embed.
+    """
+    embed = discord.Embed(title=title, description=description, color=_SUCCESS_COLOR)
+    if image is not None:
+        embed.set_image(url=image)
+
+    if thumbnail is not None:
+        embed.set_thumbnail(url=thumbnail)
+
+    if footer is not None:
+        embed.set_footer(text=footer)
+
+    return embed
+
 
 async def confirm_action(
     ctx: ValentinaContext,
@@ -46,30 +81,21 @@ async def confirm_action(
         footer=footer,
     )
     await view.wait()
+    action = title.rstrip("?")
     if not view.confirmed:
         embed = discord.Embed(
-            title=f"{Emoji.CANCEL.value} Cancelled",
-            description=title.rstrip("?"),
-            color=EmbedColor.WARNING.value,
+            title=f"{Emoji.CANCEL.value} Cancelled", description=action, color=_CANCEL_COLOR
         )
         await msg.edit_original_response(embed=embed, view=None)
         return (False, msg, None)
 
-    response_embed = discord.Embed(
-        title=title.rstrip("?"), description=description, color=EmbedColor.SUCCESS.value
+    response_embed = _success_embed(
+        action, description=description, image=image, thumbnail=thumbnail, footer=footer
     )
-    if image is not None:
-        response_embed.set_image(url=image)
-
-    if thumbnail is not None:
-        response_embed.set_thumbnail(url=thumbnail)
-
-    if footer is not None:
-        response_embed.set_footer(text=footer)
 
     if audit:
-        await ctx.post_to_audit_log(title.rstrip("?"))
+        await ctx.post_to_audit_log(action)
     else:
-        ctx.log_command(title.rstrip("?"), LogLevel.DEBUG)
+        ctx.log_command(action, LogLevel.DEBUG)
 
     return (True, msg, response_embed)
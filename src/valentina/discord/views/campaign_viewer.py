@@ -1,6 +1,8 @@
 """Interactive campaign viewer."""
 
 import textwrap
+from itertools import chain
+from operator import attrgetter
 
 import discord
 from discord.ext import pages
@@ -10,6 +12,8 @@ from valentina.discord.bot import ValentinaContext
 from valentina.models import Campaign, Statistics
 from valentina.utils.helpers import num_to_circles
 
+_DEFAULT_COLOR = EmbedColor.DEFAULT.value
+
 
 class CampaignViewer:
     """Manage and display interactive views of a campaign in a Discord context.
@@ -37,15 +41,38 @@ class CampaignViewer:
         Returns:
             list[pages.PageGroup]: A list of PageGroup objects, each representing a different section of the campaign.
         """
-        pages = [await self._home_page()]
+        home_page = await self._home_page()
+        book_pages = await self._book_pages() if self.campaign.books else []
+
+        npc_pages = [await self._npc_pages()] if self.campaign.npcs else []
 
-        if len(self.campaign.npcs) > 0:
-            pages.append(await self._npc_pages())
+        return list(chain([home_page], npc_pages, book_pages))
 
-        if len(self.campaign.books) > 0:
-            pages.extend(await self._book_pages())
+    def _paginate(self, text: str, title: str = "", heading: str = "") -> list[pages.Page]:
+        """Split text into embed pages that respect the viewer's character limit.
 
-        return pages
+        Args:
+            text (str): The text to paginate.
+            title (str, optional): The title of each embed. Defaults to "".
+            heading (str, optional): Text prepended to the description of each embed. Defaults to "".
+
+        Returns:
+            list[pages.Page]: One page per chunk of text.
+        """
+        lines = textwrap.wrap(
+            text,
+            self.max_chars,
+            break_long_words=False,
+            replace_whitespace=False,
+        )
+        return [
+            pages.Page(
+                embeds=[
+                    discord.Embed(title=title, description=heading + line, color=_DEFAULT_COLOR)
+                ]
+            )
+            for line in lines
+        ]
 
     async def _home_page(self) -> pages.PageGroup:
         """Construct the home page view of the campaign.
@@ -88,7 +115,7 @@ NPCs     : {len(self.campaign.npcs)}
         home_embed = discord.Embed(
             title="",
             description=description,
-            color=EmbedColor.DEFAULT.value,
+            color=_DEFAULT_COLOR,
         )
         home_embed.set_author(name="Campaign Overview")
         home_embed.set_footer(text="Navigate Sections with the Dropdown Menu")
@@ -109,25 +136,15 @@ NPCs     : {len(self.campaign.npcs)}
         Returns:
             pages.PageGroup: A PageGroup object containing the NPC section of the campaign.
         """
-        npc_list = sorted(self.campaign.npcs, key=lambda n: n.name)
-        npc_text = "\n\n".join([f"{n.campaign_display()}" for n in npc_list])
-        lines = textwrap.wrap(
-            npc_text,
-            self.max_chars,
-            break_long_words=False,
-            replace_whitespace=False,
+        npc_list = sorted(self.campaign.npcs, key=attrgetter("name"))
+        npc_pages = self._paginate(
+            "\n\n".join([n.campaign_display() for n in npc_list]),
+            title=f"{self.campaign.name} NPCs",
         )
-        embeds = []
-        for line in lines:
-            embed = discord.Embed(
-                title=f"{self.campaign.name} NPCs",
-                description=line,
-                color=EmbedColor.DEFAULT.value,
-            )
-            embeds.append(embed)
 
+        has_multiple_pages = len(npc_pages) > 1
         buttons = []
-        if len(embeds) > 1:
+        if has_multiple_pages:
             buttons.extend(
                 [
                     pages.PaginatorButton(
@@ -143,12 +160,12 @@ NPCs     : {len(self.campaign.npcs)}
             )
 
         return pages.PageGroup(
-            pages=[pages.Page(embeds=[embed]) for embed in embeds],
+            pages=npc_pages,
             label="Non Player Characters",
             description=f"{len(npc_list)} NPCs",
             custom_buttons=buttons,
-            show_disabled=len(embeds) > 1,
-            show_indicator=len(embeds) > 1,
+            show_disabled=has_multiple_pages,
+            show_indicator=has_multiple_pages,
             loop_pages=False,
             emoji="👥",
         )
@@ -163,40 +180,26 @@ NPCs     : {len(self.campaign.npcs)}
         """
         book_pages = []
 
-        for book in sorted(await self.campaign.fetch_books(), key=lambda b: b.number):
+        # fetch_books() returns the books ordered by number
+        for book in await self.campaign.fetch_books():
             chapters = await book.fetch_chapters()
-            book_chapter_text = "### Chapters\n"
-            book_chapter_text += "\n".join([f"{c.number}. {c.name}" for c in chapters])
-            book_notes_text = "### Notes\n"
-            book_notes_text += "\n".join(
-                [f"- {await n.display(self.ctx)}" for n in book.notes]  # type: ignore [attr-defined]
-            )
-
-            full_text = ""
+            sections = []
             if chapters:
-                full_text += f"{book_chapter_text}\n"
-            full_text += f"### Description\n{book.description_long}\n"
+                chapter_listing = "\n".join([f"{c.number}. {c.name}" for c in chapters])
+                sections.append(f"### Chapters\n{chapter_listing}")
+            sections.append(f"### Description\n{book.description_long}")
             if book.notes:
-                full_text += f"{book_notes_text}\n"
-
-            lines = textwrap.wrap(
-                full_text,
-                self.max_chars,
-                break_long_words=False,
-                replace_whitespace=False,
-            )
-            embeds = []
-            for line in lines:
-                embed = discord.Embed(
-                    title="",
-                    description=f"## Book #{book.number}: {book.name}\n" + line,
-                    color=EmbedColor.DEFAULT.value,
+                book_notes = "\n".join(
+                    [f"- {n.display(self.ctx)}" for n in book.notes]  # type: ignore [attr-defined]
                 )
-                embeds.append(embed)
+                sections.append(f"### Notes\n{book_notes}")
 
             book_page = pages.PageGroup(
-                pages=[pages.Page(embeds=[embed]) for embed in embeds],
-                label=f"{book.name}",
+                pages=self._paginate(
+                    "\n".join(sections) + "\n",
+                    heading=f"## Book #{book.number}: {book.name}\n",
+                ),
+                label=book.name,
                 description=f"Book #{book.number}",
                 custom_buttons=[
                     pages.PaginatorButton("prev", label="←", style=discord.ButtonStyle.green),
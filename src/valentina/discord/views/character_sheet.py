@@ -7,7 +7,7 @@ import discord
 from discord.ext import pages
 
 from valentina.constants import MAX_DOT_DISPLAY, EmbedColor, InventoryItemType
-from valentina.controllers import CharacterSheetBuilder, PermissionManager
+from valentina.controllers import CharacterSheetBuilder
 from valentina.discord.bot import ValentinaContext
 from valentina.models import AWSService, Character, Statistics
 
@@ -160,10 +160,9 @@ async def show_sheet(
     show_footer: bool = True,
 ) -> Any:
     """Show a character sheet."""
-    permission_mng = PermissionManager(ctx.guild.id)
-    is_storyteller = await permission_mng.is_storyteller(ctx.author.id)
+    is_storyteller = await ctx.permission_manager.is_storyteller(ctx.author.id)
 
-    owned_by_user = discord.utils.get(ctx.bot.users, id=character.user_owner)
+    owned_by_user = ctx.bot.get_user(character.user_owner)
 
     embeds = []
     embeds.extend(
@@ -199,9 +198,10 @@ async def sheet_embed(
     show_footer: bool = True,
 ) -> discord.Embed:
     """Return the first page of the sheet as an embed."""
-    permission_mng = PermissionManager(ctx.guild.id)
-    is_storyteller = await permission_mng.is_storyteller(ctx.author.id)
-    owned_by_user = discord.utils.get(ctx.bot.users, id=character.user_owner)
+    is_storyteller = await ctx.permission_manager.is_storyteller(ctx.author.id)
+    if owned_by_user is None:
+        owned_by_user = ctx.bot.get_user(character.user_owner)
+
     return await __embed1(
         character,
         owned_by_user=owned_by_user,
@@ -7,6 +7,33 @@ from valentina.constants import MAX_FIELD_COUNT, CharClass, EmbedColor
 from valentina.discord.views import ConfirmCancelButtons
 from valentina.models import CampaignBook, CampaignBookChapter, CampaignNPC, Character, Note
 
+_CANCEL_COLOR = EmbedColor.ERROR.value
+_CONFIRM_COLOR = EmbedColor.INFO.value
+
+
+def _cancel_embed(title: str = "Cancelled") -> discord.Embed:
+    """Build the embed shown when a user cancels a modal confirmation.
+
+    Args:
+        title (str, optional): The title of the embed. Defaults to "Cancelled".
+
+    Returns:
+        discord.Embed: A new cancellation embed.
+    """
+    return discord.Embed(title=title, color=_CANCEL_COLOR)
+
+
+def _confirm_embed(title: str) -> discord.Embed:
+    """Build the embed which asks a user to confirm the values entered into a modal.
+
+    Args:
+        title (str): The title of the embed.
+
+    Returns:
+        discord.Embed: A new confirmation embed.
+    """
+    return discord.Embed(title=title, color=_CONFIRM_COLOR)
+
 
 class ChangeNameModal(Modal):
     """A modal for changing the name of a character."""
@@ -141,7 +168,7 @@ class BookModal(Modal):
         self.description_short = self.children[1].value
         self.description_long = self.children[2].value
 
-        embed = discord.Embed(title="Confirm Book", color=EmbedColor.INFO.value)
+        embed = _confirm_embed("Confirm Book")
         embed.add_field(name="Book Name", value=self.name, inline=True)
         embed.add_field(name="Short Description", value=self.description_short, inline=True)
         embed.add_field(
@@ -159,9 +186,7 @@ class BookModal(Modal):
             await interaction.delete_original_response()
         else:
             self.confirmed = False
-            await interaction.edit_original_response(
-                embeds=[discord.Embed(title="Cancelled", color=EmbedColor.ERROR.value)]
-            )
+            await interaction.edit_original_response(embeds=[_cancel_embed()])
 
         self.stop()
 
@@ -213,7 +238,7 @@ class ChapterModal(Modal):
         self.description_short = self.children[1].value
         self.description_long = self.children[2].value
 
-        embed = discord.Embed(title="Confirm Chapter", color=EmbedColor.INFO.value)
+        embed = _confirm_embed("Confirm Chapter")
         embed.add_field(name="Chapter Name", value=self.name, inline=True)
         embed.add_field(name="Short Description", value=self.description_short, inline=True)
         embed.add_field(
@@ -231,9 +256,7 @@ class ChapterModal(Modal):
             await interaction.delete_original_response()
         else:
             self.confirmed = False
-            await interaction.edit_original_response(
-                embeds=[discord.Embed(title="Cancelled", color=EmbedColor.ERROR.value)]
-            )
+            await interaction.edit_original_response(embeds=[_cancel_embed()])
 
         self.stop()
 
@@ -300,9 +323,7 @@ class InventoryItemModal(Modal):
             )
         if not view.confirmed:
             self.confirmed = False
-            await interaction.edit_original_response(
-                embeds=[discord.Embed(title="Cancelled", color=EmbedColor.ERROR.value)]
-            )
+            await interaction.edit_original_response(embeds=[_cancel_embed()])
 
         self.stop()
 
@@ -344,8 +365,9 @@ class CustomSectionModal(Modal):
 
     async def callback(self, interaction: discord.Interaction) -> None:
         """Callback for the modal."""
-        self.section_title = self.children[0].value
-        self.section_content = self.children[1].value
+        # Normalize once here so callers can use the values as-is
+        self.section_title = self.children[0].value.strip().title()
+        self.section_content = self.children[1].value.strip()
 
         embed_title = "Custom Section Updated" if self.update_existing else "Custom Section Added"
         embed = discord.Embed(title=embed_title, color=EmbedColor.SUCCESS.value)
@@ -404,7 +426,7 @@ class MacroCreateModal(Modal):
         self.abbreviation = self.children[1].value
         self.description = self.children[2].value
 
-        embed = discord.Embed(title="Confirm macro creation", color=EmbedColor.INFO.value)
+        embed = _confirm_embed("Confirm macro creation")
         embed.add_field(name="Macro Name", value=self.name)
         embed.add_field(name="Abbreviation", value=self.abbreviation)
         embed.add_field(
@@ -424,9 +446,7 @@ class MacroCreateModal(Modal):
         if not view.confirmed:
             self.confirmed = False
             await interaction.edit_original_response(
-                embeds=[
-                    discord.Embed(title="Macro creation cancelled", color=EmbedColor.ERROR.value)
-                ]
+                embeds=[_cancel_embed("Macro creation cancelled")]
             )
 
         self.stop()
@@ -456,7 +476,7 @@ class NoteModal(Modal):
         view = ConfirmCancelButtons(interaction.user)
         self.note_text = self.children[0].value
 
-        embed = discord.Embed(title="Confirm Note", color=EmbedColor.INFO.value)
+        embed = _confirm_embed("Confirm Note")
         embed.add_field(
             name="note",
             value=(self.note_text[:MAX_FIELD_COUNT] + " ...")
@@ -471,9 +491,7 @@ class NoteModal(Modal):
             await interaction.delete_original_response()
         else:
             self.confirmed = False
-            await interaction.edit_original_response(
-                embeds=[discord.Embed(title="Cancelled", color=EmbedColor.ERROR.value)]
-            )
+            await interaction.edit_original_response(embeds=[_cancel_embed()])
 
         self.stop()
 
@@ -524,7 +542,7 @@ class NPCModal(Modal):
         self.npc_class = self.children[1].value
         self.description = self.children[2].value
 
-        embed = discord.Embed(title="Confirm NPC", color=EmbedColor.INFO.value)
+        embed = _confirm_embed("Confirm NPC")
         embed.add_field(name="NPC Name", value=self.name, inline=True)
         embed.add_field(name="NPC Class", value=self.npc_class, inline=True)
         embed.add_field(
@@ -540,9 +558,7 @@ class NPCModal(Modal):
             await interaction.delete_original_response()
         else:
             self.confirmed = False
-            await interaction.edit_original_response(
-                embeds=[discord.Embed(title="Cancelled", color=EmbedColor.ERROR.value)]
-            )
+            await interaction.edit_original_response(embeds=[_cancel_embed()])
 
         self.stop()
 
@@ -678,7 +694,7 @@ class ProfileModal(Modal):
         for c in self.children:
             self.results[c.custom_id] = c.value
 
-        embed = discord.Embed(title="Confirm Profile", color=EmbedColor.INFO.value)
+        embed = _confirm_embed("Confirm Profile")
 
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         await view.wait()
@@ -688,8 +704,6 @@ class ProfileModal(Modal):
             await interaction.delete_original_response()
         else:
             self.confirmed = False
-            await interaction.edit_original_response(
-                embeds=[discord.Embed(title="Cancelled", color=EmbedColor.ERROR.value)]
-            )
+            await interaction.edit_original_response(embeds=[_cancel_embed()])
 
         self.stop()
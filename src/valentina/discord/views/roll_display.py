@@ -1,5 +1,7 @@
 """Display and manipulate roll outcomes."""
 
+from functools import cached_property
+
 import discord
 import inflect
 
@@ -33,6 +35,46 @@ class RollDisplay:
         self.trait_two = trait_two
         self.desperation_pool = desperation_pool
 
+    @cached_property
+    def _static_fields(self) -> list[tuple[str, str, bool]]:
+        """The embed fields that do not depend on the dice rolled.
+
+        Re-rolls keep the same pool, difficulty, and traits, so these fields are built once and reused when the display is updated with a new roll.
+
+        Returns:
+            list[tuple[str, str, bool]]: The name, value, and inline flag of each field.
+        """
+        dice_type = self.roll.dice_type.name.lower()
+        fields = [
+            ("Difficulty", f"`{self.roll.difficulty}`", True),
+            ("Dice Pool", f"`{self.roll.pool}{dice_type}`", True),
+        ]
+
+        if self.desperation_pool > 0:
+            fields.append(("Desperation Pool", f"`{self.desperation_pool}{dice_type}`", True))
+
+        if self.trait_one:
+            fields.extend(
+                [
+                    ("\u200b", "**TRAITS**", False),
+                    (
+                        self.trait_one.name,
+                        f"`{self.trait_one.value} {p.plural_noun('die', self.trait_one.value)}`",
+                        True,
+                    ),
+                ]
+            )
+        if self.trait_two:
+            fields.append(
+                (
+                    self.trait_two.name,
+                    f"`{self.trait_two.value} {p.plural_noun('die', self.trait_two.value)}`",
+                    True,
+                )
+            )
+
+        return fields
+
     def _add_comment_field(self, embed: discord.Embed) -> discord.Embed:
         """Add the comment field to the embed."""
         if self.comment:
@@ -83,33 +125,8 @@ class RollDisplay:
                 inline=False,
             )
 
-        embed.add_field(name="Difficulty", value=f"`{self.roll.difficulty}`", inline=True)
-        embed.add_field(
-            name="Dice Pool",
-            value=f"`{self.roll.pool}{self.roll.dice_type.name.lower()}`",
-            inline=True,
-        )
-
-        if self.desperation_pool > 0:
-            embed.add_field(
-                name="Desperation Pool",
-                value=f"`{self.desperation_pool}{self.roll.dice_type.name.lower()}`",
-                inline=True,
-            )
-
-        if self.trait_one:
-            embed.add_field(name="\u200b", value="**TRAITS**", inline=False)
-            embed.add_field(
-                name=f"{self.trait_one.name}",
-                value=f"`{self.trait_one.value} {p.plural_noun('die', self.trait_one.value)}`",
-                inline=True,
-            )
-        if self.trait_two:
-            embed.add_field(
-                name=f"{self.trait_two.name}",
-                value=f"`{self.trait_two.value} {p.plural_noun('die', self.trait_two.value)}`",
-                inline=True,
-            )
+        for name, value, inline in self._static_fields:
+            embed.add_field(name=name, value=value, inline=inline)
 
         embed.set_thumbnail(url=await self.roll.thumbnail_url())
 
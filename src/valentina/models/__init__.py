@@ -14,7 +14,13 @@ from .campaign import (
     CampaignBookChapter,
     CampaignNPC,
 )
-from .character import Character, CharacterSheetSection, CharacterTrait, InventoryItem
+from .character import (
+    Character,
+    CharacterListing,
+    CharacterSheetSection,
+    CharacterTrait,
+    InventoryItem,
+)
 from .database import GlobalProperty
 from .dictionary import DictionaryTerm
 from .guild import Guild, GuildChannels, GuildPermissions, GuildRollResultThumbnail
@@ -38,6 +44,7 @@ __all__ = [
     "ChangelogParser",
     "ChangelogPoster",
     "Character",
+    "CharacterListing",
     "CharacterSheetSection",
     "CharacterTrait",
     "DiceRoll",
@@ -1,6 +1,7 @@
 """Campaign models for Valentina."""
 
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from uuid import UUID, uuid4
 
@@ -82,7 +83,7 @@ class CampaignBook(Document):
         """
         return sorted(
             self.chapters,  # type: ignore [arg-type]
-            key=lambda x: x.number,
+            key=attrgetter("number"),
         )
 
     async def update_channel_id(self, channel: discord.TextChannel) -> None:
@@ -126,7 +127,7 @@ class Campaign(Document):
     description: str | None = None
     desperation: int = 0
     danger: int = 0
-    guild: int
+    guild: Indexed(int)  # type: ignore [valid-type]
     name: str
     is_deleted: bool = False  # Campaigns are never deleted from the DB, only marked as deleted
     npcs: list[CampaignNPC] = Field(default_factory=list)
@@ -179,7 +180,7 @@ class Campaign(Document):
         """
         return sorted(
             self.books,  # type: ignore [arg-type]
-            key=lambda x: x.number,
+            key=attrgetter("number"),
         )
 
     async def delete_book(self, book: CampaignBook) -> None:
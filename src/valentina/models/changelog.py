@@ -2,6 +2,8 @@
 
 import random
 import re
+from functools import cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 import discord
@@ -23,6 +25,12 @@ if TYPE_CHECKING:
     from valentina.discord.bot import ValentinaContext
 
 
+@cache
+def _read_changelog(path: Path) -> str:
+    """Read the changelog file once per process, since it only changes between deploys."""
+    return path.read_text()
+
+
 class ChangelogPoster:  # pragma: no cover
     """Helper class for posting changelogs to the changelog channel specified in guild settings."""
 
@@ -276,7 +284,7 @@ class ChangelogParser:
             logger.error(f"Changelog file not found at {self.path}")
             raise FileNotFoundError
 
-        return self.path.read_text()
+        return _read_changelog(self.path)
 
     def __parse_changelog(self) -> dict[str, dict[str, str | list[str]]]:  # noqa: C901
         """Parse the changelog into a structured dictionary.
@@ -507,7 +515,7 @@ class ChangelogParser:
                            changelog information, ready to be sent as a message.
         """
         # Create and populate the embed description
-        description = f"Valentina, your {random.choice(['honored', 'admired', 'distinguished', 'celebrated', 'hallowed', 'prestigious', 'acclaimed', 'favorite', 'friendly neighborhood', 'prized', 'treasured', 'number one', 'esteemed', 'venerated', 'revered', 'feared'])} {random.choice(BOT_DESCRIPTIONS)}, has {random.choice(['been granted new powers', 'leveled up', 'spent experience points', 'gained new abilities', 'been bitten by a radioactive spider', 'spent willpower points', 'been updated', 'squashed bugs and gained new features',])}!\n"
+        description = f"Valentina, your {random.choice(['honored', 'admired', 'distinguished', 'celebrated', 'hallowed', 'prestigious', 'acclaimed', 'favorite', 'friendly neighborhood', 'prized', 'treasured', 'number one', 'esteemed', 'venerated', 'revered', 'feared'])} {random.choice(BOT_DESCRIPTIONS)}, has {random.choice(['been granted new powers', 'leveled up', 'spent experience points', 'gained new abilities', 'been bitten by a radioactive spider', 'spent willpower points', 'been updated', 'squashed bugs and gained new features'])}!\n"
 
         description += self.get_text()
         description += "- Run `/changelog` to view specific versions\n"
@@ -12,6 +12,7 @@ from beanie import (
     Indexed,
     Insert,
     Link,
+    PydanticObjectId,
     Replace,
     Save,
     SaveChanges,
@@ -20,6 +21,7 @@ from beanie import (
 )
 from loguru import logger
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
 
 from valentina.constants import (
     CharacterConcept,
@@ -31,7 +33,7 @@ from valentina.constants import (
 )
 from valentina.models.aws import AWSService
 from valentina.utils import errors
-from valentina.utils.helpers import num_to_circles, time_now
+from valentina.utils.helpers import invalidate_trait_options, num_to_circles, time_now
 
 from .note import Note
 
@@ -39,6 +41,14 @@ p = inflect.engine()
 p.defnoun("Ability", "Abilities")
 
 
+def _format_full_name(name_first: str, name_nick: str | None, name_last: str | None) -> str:
+    """Format a character's full name as `First 'Nick' Last`, omitting any missing parts."""
+    nick = f" '{name_nick}'" if name_nick else ""
+    last = f" {name_last}" if name_last else ""
+
+    return f"{name_first}{nick}{last}".strip()
+
+
 class CharacterSheetSection(BaseModel):
     """Represent a character sheet section as a subdocument within Character.
 
@@ -113,6 +123,23 @@ class InventoryItem(Document):
     type: str  # InventoryItemType enum name
 
 
+class CharacterListing(BaseModel):
+    """Project the fields needed to list a character without loading the full document.
+
+    Use this with `.project()` when only names and classes are displayed, so Mongo returns a few small fields rather than every character's sheet sections, links, and profile.
+    """
+
+    char_class_name: str
+    name_first: str
+    name_last: str
+    name_nick: str | None = None
+
+    @property
+    def full_name(self) -> str:
+        """Return the character's full name."""
+        return _format_full_name(self.name_first, self.name_nick, self.name_last)
+
+
 class Character(Document):
     """Represent a character in the database.
 
@@ -170,6 +197,21 @@ class Character(Document):
     tribe: str | None = None  # WerewolfTribe enum name or other
     totem: str | None = None
 
+    class Settings:
+        """Beanie settings for the Character collection."""
+
+        # Serves character lists filtered by guild and type and sorted by name, such as the storyteller character list, without an in-memory sort
+        indexes = (
+            IndexModel(
+                [
+                    ("guild", ASCENDING),
+                    ("type_storyteller", ASCENDING),
+                    ("name_first", ASCENDING),
+                    ("name_last", ASCENDING),
+                ]
+            ),
+        )
+
     @before_event(Insert, Replace, Save, Update, SaveChanges)
     async def update_modified_date(self) -> None:
         """Update the date_modified field."""
@@ -183,10 +225,7 @@ class Character(Document):
     @property
     def full_name(self) -> str:
         """Return the character's full name."""
-        nick = f" '{self.name_nick}'" if self.name_nick else ""
-        last = f" {self.name_last}" if self.name_last else ""
-
-        return f"{self.name_first}{nick}{last}".strip()
+        return _format_full_name(self.name_first, self.name_nick, self.name_last)
 
     @property
     def channel_name(self) -> str:
@@ -306,27 +345,70 @@ class Character(Document):
         await trait.save()
         self.traits.append(trait)
         await self.save()
+        invalidate_trait_options(self.guild, self.channel)
 
         return trait
 
-    async def delete_trait(self, trait_id: str) -> None:
+    async def add_traits(self, traits: list["CharacterTrait"]) -> list["CharacterTrait"]:
+        """Associate multiple new traits with the character using a single bulk insert.
+
+        Use this instead of calling `add_trait` in a loop when creating many traits at once, such as during character generation. Traits with the same name and category as an existing trait are skipped and logged rather than raising an error.
+
+        Args:
+            traits (list[CharacterTrait]): The new traits to add to the character.
+
+        Returns:
+            list[CharacterTrait]: The traits which were added to the character.
+        """
+        await self.fetch_all_links()
+
+        existing_keys = {
+            (x.name.lower(), x.category_name) for x in cast(list[CharacterTrait], self.traits)
+        }
+
+        traits_to_add = []
+        for trait in traits:
+            key = (trait.name.lower(), trait.category_name)
+            if key in existing_keys:
+                logger.warning(
+                    f"Trait named '{trait.name}' already exists in category '{trait.category_name}' for character '{self.name}'"
+                )
+                continue
+
+            existing_keys.add(key)
+            trait.character = str(self.id)
+            # insert_many does not write generated ids back to the documents so we set them here
+            trait.id = trait.id or PydanticObjectId()
+            traits_to_add.append(trait)
+
+        if not traits_to_add:
+            return []
+
+        await CharacterTrait.insert_many(traits_to_add)
+        self.traits.extend(traits_to_add)
+        await self.save()
+        invalidate_trait_options(self.guild, self.channel)
+
+        return traits_to_add
+
+    async def delete_trait(self, trait_id: str | PydanticObjectId) -> None:
         """Delete a trait from the character and update the database.
 
         Remove a trait from both the character's trait list and the database. This is useful
         when a trait needs to be completely removed rather than just having its value changed.
 
         Args:
-            trait_id (str): The unique identifier of the trait to delete.
+            trait_id (str | PydanticObjectId): The unique identifier of the trait to delete.
 
         Returns:
             None
         """
-        trait = await CharacterTrait.get(trait_id)
-        if trait:
-            await trait.delete()
+        # Delete by id in a single query rather than loading the trait first
+        await CharacterTrait.find_one(CharacterTrait.id == PydanticObjectId(trait_id)).delete()
 
         self.traits = [trait for trait in self.traits if str(trait.id) != str(trait_id)]  # type: ignore [attr-defined]
         await self.save()
+        invalidate_trait_options(self.guild, self.channel)
 
     def concept_description(self) -> str:
         """Return a text description of the character's concept and special abilities.
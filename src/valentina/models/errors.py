@@ -20,7 +20,7 @@ class ErrorReporter:
         self.channel: discord.TextChannel = None
 
     @staticmethod
-    def _handle_known_exceptions(  # noqa: C901
+    def _handle_known_exceptions(  # noqa: C901, PLR0912
         ctx: discord.ApplicationContext, error: Exception
     ) -> tuple[str | None, str | None, bool]:
         """Handle known exceptions and return user message, log message, and traceback flag.
@@ -96,6 +96,12 @@ class ErrorReporter:
             log_msg = "ERROR: No context provided"
             show_traceback = True
 
+        if isinstance(error, commands.CommandOnCooldown):
+            user_msg = f"Slow down! Try again in {error.retry_after:.0f} seconds."
+
+        if isinstance(error, commands.MaxConcurrencyReached):
+            user_msg = "This command is already running for you; finish it first."
+
         if isinstance(error, commands.BadArgument):
             user_msg = "Invalid argument provided"
 
@@ -3,7 +3,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-import discord
 from beanie import (
     Document,
     Insert,
@@ -36,8 +35,11 @@ class Note(Document):
         """Update the date_modified field."""
         self.date_modified = time_now()
 
-    async def display(self, ctx: "ValentinaContext") -> str:
-        """Display the note in markdown format."""
-        creator = discord.utils.get(ctx.bot.users, id=self.created_by)
+    def display(self, ctx: "ValentinaContext") -> str:
+        """Display the note in markdown format.
+
+        The creator is resolved from the bot's user cache, so no network requests are made.
+        """
+        creator = ctx.bot.get_user(self.created_by)
 
         return f"{self.text.capitalize()} _`@{creator.display_name if creator else 'Unknown'}`_"
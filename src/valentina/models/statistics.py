@@ -1,7 +1,7 @@
 """Compute and display statistics."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import discord
 from beanie import Document, Indexed
@@ -146,13 +146,13 @@ class Statistics:
             return msg
 
         msg += f"""\
-`Total Rolls {'.':.<{25 - 12}} {self.total_rolls}`
-`Critical Success Rolls {'.':.<{25 - 23}} {self.criticals:<3} ({self.criticals_percentage}%)`
-`Successful Rolls {'.':.<{25 - 17}} {self.successes:<3} ({self.success_percentage}%)`
-`Failed Rolls {'.':.<{25 - 13}} {self.failures:<3} ({self.failure_percentage}%)`
-`Botched Rolls {'.':.<{25 - 14}} {self.botches:<3} ({self.botch_percentage}%)`
-`Average Difficulty {'.':.<{25 - 19}} {self.average_difficulty}`
-`Average Pool Size {'.':.<{25 - 18}} {self.average_pool}`
+`Total Rolls {".":.<{25 - 12}} {self.total_rolls}`
+`Critical Success Rolls {".":.<{25 - 23}} {self.criticals:<3} ({self.criticals_percentage}%)`
+`Successful Rolls {".":.<{25 - 17}} {self.successes:<3} ({self.success_percentage}%)`
+`Failed Rolls {".":.<{25 - 13}} {self.failures:<3} ({self.failure_percentage}%)`
+`Botched Rolls {".":.<{25 - 14}} {self.botches:<3} ({self.botch_percentage}%)`
+`Average Difficulty {".":.<{25 - 19}} {self.average_difficulty}`
+`Average Pool Size {".":.<{25 - 18}} {self.average_pool}`
 """
 
         if with_help:
@@ -198,6 +198,45 @@ class Statistics:
         )
         return embed
 
+    async def _load_statistics(self, condition: Any) -> None:
+        """Load roll counts and averages for the rolls matching a condition.
+
+        Count every roll result and sum the difficulty and pool sizes in a single aggregation rather than querying once per result type and average.
+
+        Args:
+            condition (Any): The Beanie query condition selecting the rolls to include.
+        """
+        results = (
+            await RollStatistic.find(condition)
+            .aggregate(
+                [
+                    {
+                        "$group": {
+                            "_id": "$result",
+                            "count": {"$sum": 1},
+                            "difficulty": {"$sum": "$difficulty"},
+                            "pool": {"$sum": "$pool"},
+                        }
+                    }
+                ]
+            )
+            .to_list()
+        )
+        counts = {RollResultType(row["_id"]): row["count"] for row in results}
+
+        self.botches = counts.get(RollResultType.BOTCH, 0)
+        self.successes = counts.get(RollResultType.SUCCESS, 0)
+        self.criticals = counts.get(RollResultType.CRITICAL, 0)
+        self.failures = counts.get(RollResultType.FAILURE, 0)
+        self.other = counts.get(RollResultType.OTHER, 0)
+        self.total_rolls = sum(row["count"] for row in results)
+
+        if self.total_rolls:
+            self.average_difficulty = round(
+                sum(row["difficulty"] for row in results) / self.total_rolls
+            )
+            self.average_pool = round(sum(row["pool"] for row in results) / self.total_rolls)
+
     async def guild_statistics(
         self,
         as_embed: bool = False,
@@ -241,41 +280,7 @@ class Statistics:
             self.thumbnail = self.ctx.guild.icon.url if self.ctx.guild.icon else ""
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.guild == guild_id).avg(
-            RollStatistic.difficulty
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.guild == guild_id).avg(RollStatistic.pool)
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._load_statistics(RollStatistic.guild == guild_id)
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -316,41 +321,7 @@ class Statistics:
             self.thumbnail = user.display_avatar.url
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.user == user.id).avg(
-            RollStatistic.difficulty
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.user == user.id).avg(RollStatistic.pool)
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._load_statistics(RollStatistic.user == user.id)
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -389,43 +360,7 @@ class Statistics:
         self.title = f"Roll statistics for {character.name}"
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.character == str(character.id)).avg(
-            RollStatistic.difficulty
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.character == str(character.id)).avg(
-            RollStatistic.pool
-        )
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._load_statistics(RollStatistic.character == str(character.id))
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -465,43 +400,7 @@ class Statistics:
         self.title = f"Roll statistics for {campaign.name}"
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.campaign == str(campaign.id)).avg(
-            RollStatistic.difficulty
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.campaign == str(campaign.id)).avg(
-            RollStatistic.pool
-        )
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._load_statistics(RollStatistic.campaign == str(campaign.id))
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -13,8 +13,10 @@ from beanie import (
     Save,
     SaveChanges,
     Update,
+    UpdateResponse,
     before_event,
 )
+from beanie.operators import Inc, Set
 from pydantic import BaseModel, Field
 
 from valentina.constants import COOL_POINT_VALUE
@@ -133,6 +135,22 @@ class User(Document):
         except KeyError as e:
             raise errors.NoExperienceInCampaignError from e
 
+    def _fetch_or_create_campaign_xp(self, campaign: Campaign) -> CampaignExperience:
+        """Return the user's campaign experience for a campaign, creating an empty entry if needed.
+
+        Args:
+            campaign (Campaign): The campaign to fetch experience for.
+
+        Returns:
+            CampaignExperience: The user's campaign experience for the specified campaign.
+        """
+        key = str(campaign.id)
+        campaign_experience = self.campaign_experience.get(key)
+        if campaign_experience is None:
+            campaign_experience = self.campaign_experience[key] = CampaignExperience()
+
+        return campaign_experience
+
     def fetch_campaign_xp(self, campaign: Campaign) -> tuple[int, int, int]:
         """Fetch and return the user's campaign experience for a given campaign.
 
@@ -147,12 +165,11 @@ class User(Document):
                 If the user has no experience in the campaign, return (0, 0, 0).
 
         Note:
-            This method handles the NoExperienceInCampaignError internally and
-            returns default values instead of raising an exception.
+            Default values are returned instead of raising an exception when the
+            user has no experience in the campaign.
         """
-        try:
-            campaign_experience = self._find_campaign_xp(campaign)
-        except errors.NoExperienceInCampaignError:
+        campaign_experience = self.campaign_experience.get(str(campaign.id))
+        if campaign_experience is None:
             return 0, 0, 0
 
         return (
@@ -161,6 +178,69 @@ class User(Document):
             campaign_experience.cool_points,
         )
 
+    async def _save_campaign_xp(
+        self, campaign: Campaign, campaign_experience: CampaignExperience
+    ) -> None:
+        """Persist the user's experience for a single campaign.
+
+        Write only the campaign's experience subdocument in one update instead of replacing the entire user document. If the user does not yet exist in the database, insert it.
+
+        Args:
+            campaign (Campaign): The campaign the experience belongs to.
+            campaign_experience (CampaignExperience): The updated experience to persist.
+        """
+        self.date_modified = time_now()
+        await User.find_one(User.id == self.id).upsert(
+            Set(
+                {
+                    f"campaign_experience.{campaign.id}": campaign_experience,
+                    "date_modified": self.date_modified,
+                }
+            ),
+            on_insert=self,
+        )
+
+    async def _increment_campaign_xp(
+        self, campaign: Campaign, xp_current: int = 0, xp_total: int = 0, cool_points: int = 0
+    ) -> CampaignExperience:
+        """Atomically increment the user's experience for a single campaign.
+
+        Apply the increments with one `$inc` update which returns the new values, so concurrent grants from other copies of this user are never overwritten by a stale read. If the user does not yet exist in the database, apply the increments locally and insert it.
+
+        Args:
+            campaign (Campaign): The campaign the experience belongs to.
+            xp_current (int): The amount to add to the current experience.
+            xp_total (int): The amount to add to the total experience.
+            cool_points (int): The amount to add to the cool points.
+
+        Returns:
+            CampaignExperience: The user's updated experience for the campaign.
+        """
+        key = str(campaign.id)
+        self.date_modified = time_now()
+        updated_user = await User.find_one(User.id == self.id).update(
+            Inc(
+                {
+                    f"campaign_experience.{key}.xp_current": xp_current,
+                    f"campaign_experience.{key}.xp_total": xp_total,
+                    f"campaign_experience.{key}.cool_points": cool_points,
+                }
+            ),
+            Set({"date_modified": self.date_modified}),
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+
+        if updated_user is None:
+            campaign_experience = self._fetch_or_create_campaign_xp(campaign)
+            campaign_experience.xp_current += xp_current
+            campaign_experience.xp_total += xp_total
+            campaign_experience.cool_points += cool_points
+            await self._save_campaign_xp(campaign, campaign_experience)
+            return campaign_experience
+
+        self.campaign_experience[key] = updated_user.campaign_experience[key]
+        return self.campaign_experience[key]
+
     async def spend_campaign_xp(self, campaign: Campaign, amount: int) -> int:
         """Spend experience points for a specific campaign.
 
@@ -180,17 +260,24 @@ class User(Document):
                 experience points to spend the specified amount.
         """
         campaign_experience = self._find_campaign_xp(campaign)
+        key = str(campaign.id)
 
-        new_xp = campaign_experience.xp_current - amount
+        # Check the balance in the database rather than in this copy of the user, which may be stale after waiting for a confirmation
+        self.date_modified = time_now()
+        updated_user = await User.find_one(
+            User.id == self.id, {f"campaign_experience.{key}.xp_current": {"$gte": amount}}
+        ).update(
+            Inc({f"campaign_experience.{key}.xp_current": -amount}),
+            Set({"date_modified": self.date_modified}),
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
 
-        if new_xp < 0:
+        if updated_user is None:
             msg = f"Can not spend {amount} xp with only {campaign_experience.xp_current} available"
             raise errors.NotEnoughExperienceError(msg)
 
-        campaign_experience.xp_current = new_xp
-        await self.save()
-
-        return new_xp
+        self.campaign_experience[key] = updated_user.campaign_experience[key]
+        return self.campaign_experience[key].xp_current
 
     async def add_campaign_xp(
         self, campaign: Campaign, amount: int, increase_lifetime: bool = True
@@ -209,19 +296,12 @@ class User(Document):
             int: The new current experience points for the campaign after addition.
 
         Note:
-            This method handles the NoExperienceInCampaignError internally by creating
-            a new CampaignExperience entry if needed.
+            A new CampaignExperience entry is created if the user has no experience
+            in the campaign.
         """
-        try:
-            campaign_experience = self._find_campaign_xp(campaign)
-        except errors.NoExperienceInCampaignError:
-            campaign_experience = CampaignExperience()
-            self.campaign_experience[str(campaign.id)] = campaign_experience
-
-        campaign_experience.xp_current += amount
-        if increase_lifetime:
-            campaign_experience.xp_total += amount
-        await self.save()
+        campaign_experience = await self._increment_campaign_xp(
+            campaign, xp_current=amount, xp_total=amount if increase_lifetime else 0
+        )
 
         return campaign_experience.xp_current
 
@@ -240,19 +320,13 @@ class User(Document):
             int: The new total of cool points for the campaign after addition.
 
         Note:
-            This method handles the NoExperienceInCampaignError internally by creating
-            a new CampaignExperience entry if needed.
+            A new CampaignExperience entry is created if the user has no experience
+            in the campaign.
         """
-        try:
-            campaign_experience = self._find_campaign_xp(campaign)
-        except errors.NoExperienceInCampaignError:
-            campaign_experience = CampaignExperience()
-            self.campaign_experience[str(campaign.id)] = campaign_experience
-
-        campaign_experience.cool_points += amount
-        campaign_experience.xp_total += amount * COOL_POINT_VALUE
-        campaign_experience.xp_current += amount * COOL_POINT_VALUE
-        await self.save()
+        xp_amount = amount * COOL_POINT_VALUE
+        campaign_experience = await self._increment_campaign_xp(
+            campaign, xp_current=xp_amount, xp_total=xp_amount, cool_points=amount
+        )
 
         return campaign_experience.cool_points
 
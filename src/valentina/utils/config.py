@@ -45,6 +45,9 @@ class ValentinaConfig(BaseConfig):  # type: ignore [misc]
     log_level_pymongo: str = "WARNING"
     log_level: str = "INFO"
     mongo_database_name: str = "valentina"
+    mongo_max_idle_time_ms: int = 600000
+    mongo_max_pool_size: int = 20
+    mongo_min_pool_size: int = 5
     mongo_uri: str = "mongodb://localhost:27017"
     owner_channels: str
     owner_ids: str | None = None
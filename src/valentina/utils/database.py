@@ -51,6 +51,7 @@ async def init_database(client=None, database=None) -> None:  # type: ignore [no
     """Initialize the database connection and set up Beanie ODM.
 
     This function initializes the database connection using the provided client or creates a new one if not provided.
+    New clients keep a pool of warm connections, sized by the `mongo_*_pool_size` settings, which are shared by all database calls.
     It then sets up the Beanie ODM with the specified document models.
 
     Args:
@@ -58,12 +59,20 @@ async def init_database(client=None, database=None) -> None:  # type: ignore [no
         database (AsyncIOMotorDatabase, optional): The existing database instance. If None, a new database will be selected from the client.
     """
     logger.debug("DB: Initializing...")
-    mongo_uri = ValentinaConfig().mongo_uri
-    db_name = ValentinaConfig().mongo_database_name
+    config = ValentinaConfig()
+    mongo_uri = config.mongo_uri
+    db_name = config.mongo_database_name
 
     # Create Motor client
     if not client:
-        client = AsyncIOMotorClient(f"{mongo_uri}", tz_aware=True, serverSelectionTimeoutMS=1800)
+        client = AsyncIOMotorClient(
+            f"{mongo_uri}",
+            tz_aware=True,
+            serverSelectionTimeoutMS=1800,
+            minPoolSize=config.mongo_min_pool_size,
+            maxPoolSize=config.mongo_max_pool_size,
+            maxIdleTimeMS=config.mongo_max_idle_time_ms,
+        )
 
     # Initialize beanie with the Sample document class and a database
     await init_beanie(
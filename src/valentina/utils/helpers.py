@@ -4,15 +4,45 @@ import io
 import random
 import string
 from datetime import UTC, datetime
+from functools import lru_cache
 from urllib.parse import urlencode
 
+import inflect
 from aiohttp import ClientSession
 from numpy.random import default_rng
 
-from valentina.constants import MaxTraitValue, XPMultiplier, XPNew
+from valentina.constants import NAME_GENDERS, MaxTraitValue, XPMultiplier, XPNew
 from valentina.utils import errors
 
 _rng = default_rng()
+_inflect = inflect.engine()
+
+# Number of (trait, category) pairs to memoize in the trait lookup helpers
+TRAIT_LOOKUP_CACHE_SIZE = 512
+
+# Number of nouns whose plural forms are memoized by `pluralize`
+PLURAL_CACHE_SIZE = 128
+
+# Number of names to request from randomuser.me at once. Unused names are kept for later calls.
+RANDOM_NAME_POOL_SIZE = 100
+_random_name_pool: dict[tuple[str, str], list[tuple[str, str]]] = {}
+
+# Trait autocomplete options for each character channel, keyed on (guild id, channel id). Each entry holds the expiry
+# time, the lowercased trait names in sorted order and the matching (name, id) pairs so prefixes can be found by bisection.
+# Kept here rather than with the autocomplete so the Character model can drop entries whenever it writes traits.
+trait_option_cache: dict[tuple[int, int], tuple[float, list[str], list[tuple[str, str]]]] = {}
+
+
+def invalidate_trait_options(guild: int, channel: int | None) -> None:
+    """Drop the cached trait autocomplete options for a character channel.
+
+    Called by the Character model whenever traits are added or removed so the next keystroke reflects the change instead of waiting for the cache to expire.
+
+    Args:
+        guild (int): The id of the character's guild.
+        channel (int | None): The id of the character's channel.
+    """
+    trait_option_cache.pop((guild, channel), None)
 
 
 def convert_int_to_emoji(num: int, markdown: bool = False, images: bool = False) -> str:
@@ -114,23 +144,33 @@ async def fetch_random_name(
         (first_name, last_name). If results == 1, returns a single tuple (first_name, last_name).
     """
     if not gender:
-        gender = random.choice(["male", "female"])
-
-    params = {"gender": gender, "nat": country, "inc": "name", "results": results}
-    url = f"https://randomuser.me/api/?{urlencode(params)}"
-
-    async with ClientSession() as session, session.get(url) as res:
-        if 300 > res.status >= 200:  # noqa: PLR2004
-            data = await res.json()
-
-            result = [
-                (result["name"]["first"], result["name"]["last"]) for result in data["results"]
-            ]
-
-            if len(result) == 1:
-                return result[0]
-
-            return result
+        gender = random.choice(NAME_GENDERS)
+
+    # Serve names from a pool of earlier results so most calls do not need an API request
+    pool = _random_name_pool.setdefault((gender, country), [])
+    if len(pool) < results:
+        params = {
+            "gender": gender,
+            "nat": country,
+            "inc": "name",
+            "results": max(results, RANDOM_NAME_POOL_SIZE),
+        }
+        url = f"https://randomuser.me/api/?{urlencode(params)}"
+
+        async with ClientSession() as session, session.get(url) as res:
+            if 300 > res.status >= 200:  # noqa: PLR2004
+                data = await res.json()
+                pool.extend(
+                    (result["name"]["first"], result["name"]["last"]) for result in data["results"]
+                )
+
+    if pool and len(pool) >= results:
+        result = [pool.pop() for _ in range(results)]
+
+        if len(result) == 1:
+            return result[0]
+
+        return result
 
     return [("John", "Doe")]
 
@@ -198,6 +238,7 @@ def divide_total_randomly(
     return segments
 
 
+@lru_cache(maxsize=TRAIT_LOOKUP_CACHE_SIZE)
 def get_max_trait_value(trait: str, category: str) -> int | None:
     """Get the maximum value for a trait by looking up the trait in the XPMultiplier enum.
 
@@ -220,6 +261,7 @@ def get_max_trait_value(trait: str, category: str) -> int | None:
     return MaxTraitValue.DEFAULT.value
 
 
+@lru_cache(maxsize=TRAIT_LOOKUP_CACHE_SIZE)
 def get_trait_multiplier(trait: str, category: str) -> int:
     """Get the experience multiplier associated with a trait for use when upgrading.
 
@@ -239,6 +281,7 @@ def get_trait_multiplier(trait: str, category: str) -> int:
     return XPMultiplier.DEFAULT.value
 
 
+@lru_cache(maxsize=TRAIT_LOOKUP_CACHE_SIZE)
 def get_trait_new_value(trait: str, category: str) -> int:
     """Get the experience cost of the first dot for a wholly new trait from the XPNew enum.
 
@@ -315,6 +358,25 @@ def truncate_string(text: str, max_length: int = 1000) -> str:
     return text
 
 
+@lru_cache(maxsize=PLURAL_CACHE_SIZE)
+def _plural_form(word: str) -> str:
+    """Return the plural form of a noun, memoizing inflect's rule matching."""
+    return _inflect.plural_noun(word)
+
+
+def pluralize(word: str, count: int) -> str:
+    """Return the singular or plural form of a noun to match a count.
+
+    Args:
+        word (str): The singular noun.
+        count (int): The number of items the noun describes.
+
+    Returns:
+        str: The noun unchanged when the count is one, otherwise its plural form.
+    """
+    return word if count == 1 else _plural_form(word)
+
+
 def time_now() -> datetime:
     """Return the current time in UTC.
 
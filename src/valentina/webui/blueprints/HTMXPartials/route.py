@@ -10,6 +10,7 @@ from quart.views import MethodView
 from quart_wtf import QuartForm
 
 from valentina.constants import BrokerTaskType, HTTPStatus
+from valentina.discord.utils.autocomplete import invalidate_macro_options
 from valentina.models import (
     BrokerTask,
     Campaign,
@@ -417,6 +418,7 @@ class EditTableView(MethodView):
                     parent_id = str(user.id)
 
                     await user.save()
+                    invalidate_macro_options(user.id)
                     msg = f"Update Macro: `{item.name}`"
 
                 case _:  # pragma: no cover
@@ -570,6 +572,7 @@ class EditTableView(MethodView):
 
                     user.macros.append(item)
                     await user.save()
+                    invalidate_macro_options(user.id)
                     parent_id = str(user.id)
                     msg = f"Create Macro: `{form.data['name']}`"
 
@@ -618,13 +621,13 @@ class EditTableView(MethodView):
             case TableType.NOTE:
                 note = await Note.get(item_id)
                 if character := await Character.get(note.parent_id, fetch_links=True):
-                    character.notes.remove(note)
+                    character.notes = [x for x in character.notes if x.id != note.id]
                     await character.save()
                 elif book := await CampaignBook.get(note.parent_id, fetch_links=True):
-                    book.notes.remove(note)
+                    book.notes = [x for x in book.notes if x.id != note.id]
                     await book.save()
                 elif campaign := await Campaign.get(note.parent_id, fetch_links=True):
-                    campaign.notes.remove(note)
+                    campaign.notes = [x for x in campaign.notes if x.id != note.id]
                     await campaign.save()
 
                 await note.delete()
@@ -672,6 +675,7 @@ class EditTableView(MethodView):
 
                 user.macros.remove(macro)
                 await user.save()
+                invalidate_macro_options(user.id)
                 msg = f"Delete Macro: `{macro.name}`"
 
             case _:  # pragma: no cover
@@ -106,23 +106,22 @@ async def finalize_character_creation(
     sheet_builder = CharacterSheetBuilder(character=character)
     sheet_traits = sheet_builder.fetch_all_class_traits()
 
-    for section in sheet_traits:
-        for category in section.categories:
-            if category.traits_for_creation:
-                for trait in category.traits_for_creation:
-                    trait_obj = CharacterTrait(
-                        name=trait.name,
-                        value=0,
-                        category_name=trait.category.name,
-                        character=str(character.id),
-                        max_value=int(trait.max_value),
-                    )
-                    await trait_obj.save()
-                    character.traits.append(trait_obj)
-                    console.log(f"Saved trait {trait_obj.name}")
+    new_traits = [
+        CharacterTrait(
+            name=trait.name,
+            value=0,
+            category_name=trait.category.name,
+            character=str(character.id),
+            max_value=int(trait.max_value),
+        )
+        for section in sheet_traits
+        for category in section.categories
+        for trait in category.traits_for_creation
+    ]
 
+    # Insert every trait in one bulk write rather than saving them one at a time
+    await character.add_traits(new_traits)
     console.log(f"{len(character.traits)=}")
-    await character.save()
 
     user = await fetch_user(fetch_links=True)
     user.characters.append(character)
@@ -13,7 +13,7 @@ from valentina.constants import (
     HTTPStatus,
     RNGCharLevel,
 )
-from valentina.controllers import RNGCharGen, delete_character
+from valentina.controllers import RNGCharGen, discard_draft_character
 from valentina.models import BrokerTask, Character
 from valentina.webui import catalog
 from valentina.webui.utils import fetch_active_campaign, fetch_user, update_session
@@ -33,7 +33,7 @@ class CreateRNGCharacter(MethodView):
             Character.user_owner == session["USER_ID"],
         ):
             logger.debug(f"Draft RNG characters out of state, deleting invalid character {char.id}")
-            await delete_character(char)
+            await discard_draft_character(char)
 
         # Create three new RNG characters for the user to choose from
         user = await fetch_user()
@@ -86,7 +86,7 @@ class CreateRNGCharacter(MethodView):
                 # Delete characters that were not selected
                 if num != selected_character_num:
                     logger.debug(f"CHARGEN: Deleting unselected character {character_id}")
-                    await delete_character(character)
+                    await discard_draft_character(character)
                     continue
 
                 # Add the selected character to the campaign and the player or storyteller
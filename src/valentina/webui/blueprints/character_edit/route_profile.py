@@ -19,6 +19,7 @@ from wtforms.validators import DataRequired, Length, Optional
 
 from valentina.constants import (
     BrokerTaskType,
+    CharClass,
     HTTPStatus,
     HunterCreed,
     VampireClan,
@@ -147,7 +148,9 @@ class ProfileForm(QuartForm):
         if is_alive.data != str(character.is_alive):
             permission_manager = PermissionManager(guild_id=session["GUILD_ID"])
             if not await permission_manager.can_kill_character(
-                author_id=session["USER_ID"], character_id=self.character_id.data
+                author_id=session["USER_ID"],
+                character_id=self.character_id.data,
+                character=character,
             ):
                 msg = "You do not have permissions to kill or revive this character."
                 raise ValidationError(msg)
@@ -179,13 +182,13 @@ class EditProfile(MethodView):
         }
 
         form = await ProfileForm().create_form(data=data_from_db)
-        if character.char_class_name != "HUNTER":
+        if character.char_class_name != CharClass.HUNTER.name:
             del form.creed_name
-        if character.char_class_name != "VAMPIRE":
+        if character.char_class_name != CharClass.VAMPIRE.name:
             del form.clan_name
             del form.sire
             del form.generation
-        if character.char_class_name not in ("WEREWOLF", "CHANGELING"):
+        if character.char_class_name not in {CharClass.WEREWOLF.name, CharClass.CHANGELING.name}:
             del form.breed
             del form.tribe
             del form.auspice
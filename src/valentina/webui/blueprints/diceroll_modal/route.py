@@ -4,6 +4,7 @@ None of the routes in this blueprint load full pages. They are all partials that
 Start by calling RollType. This will return the outer partial which contains the roll type selector alloing a user to select between rolling dice, traits, or macros.  Each of those forms makes a POST request to RollResults which will return the result partial in a div#roll-results.
 """
 
+import asyncio
 import json
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar, assert_never
@@ -234,12 +235,15 @@ class RollResults(MethodView):
             campaign=campaign,
         )
 
-        await roll.log_roll(traits=list(rolled_traits))
+        # Logging the roll and looking up the result thumbnail are independent
+        result_image_url, _ = await asyncio.gather(
+            roll.thumbnail_url(), roll.log_roll(traits=list(rolled_traits))
+        )
 
         return catalog.render(
             "diceroll_modal.RollResult",
             roll=roll,
             rolled_traits=rolled_traits,
-            result_image_url=await roll.thumbnail_url(),
+            result_image_url=result_image_url,
             result_div_class=self._get_result_div_classes(roll.result_type),
         )
@@ -81,6 +81,38 @@ async def test_cp_add(async_mock_ctx1, mock_bot, user_factory, campaign_factory,
     assert db_user.fetch_campaign_xp(campaign) == (10, 10, 1)
 
 
+@pytest.mark.drop_db
+@pytest.mark.parametrize("command", ["xp_add", "cp_add"])
+async def test_add_invalid_amount(
+    async_mock_ctx1, mock_bot, user_factory, campaign_factory, command
+):
+    """Test that xp_add and cp_add reject amounts below one before asking for confirmation."""
+    # GIVEN a mock context, a user, and a campaign
+    user = user_factory.build(
+        id=async_mock_ctx1.author.id,
+        characters=[],
+        campaign_experience={},
+        macros=[],
+    )
+    await user.insert()
+
+    campaign = campaign_factory.build()
+    await campaign.insert()
+
+    # WHEN the command is called with an amount of zero
+    await getattr(Experience(bot=mock_bot), command)(
+        async_mock_ctx1,
+        async_mock_ctx1,
+        amount=0,
+        user=None,
+        hidden=False,
+    )
+
+    # THEN no experience is added
+    db_user = await User.get(async_mock_ctx1.author.id)
+    assert db_user.fetch_campaign_xp(campaign) == (0, 0, 0)
+
+
 # @pytest.mark.skip(reason="Broke with pycord 2.5.0")
 @pytest.mark.drop_db
 async def test_xp_spend(
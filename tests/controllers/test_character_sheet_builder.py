@@ -124,3 +124,9 @@ def test_fetch_all_class_traits(debug, character_factory) -> None:
 
     unorganized_traits = sheet_builder.fetch_all_class_traits_unorganized()
     assert len(unorganized_traits) == 70
+
+    # Modifying the returned lists does not affect subsequent calls
+    unorganized_traits.pop(0)
+    sheet_data[0].categories[0].traits_for_creation.clear()
+    assert len(sheet_builder.fetch_all_class_traits_unorganized()) == 70
+    assert sheet_builder.fetch_all_class_traits()[0].categories[0].traits_for_creation
@@ -4,8 +4,8 @@
 import pytest
 
 from tests.factories import *
-from valentina.controllers import delete_character
-from valentina.models import Character
+from valentina.controllers import delete_character, discard_draft_character
+from valentina.models import Character, CharacterTrait
 
 
 @pytest.mark.skip(reason="Skipping until we have a way to mock the import of bot")
@@ -43,3 +43,27 @@ async def test_delete_character(debug, user_factory, character_factory, guild_fa
 
     assert len(refreshed_user.characters) == 1
     assert refreshed_user.characters[0].id == character2.id
+
+
+@pytest.mark.drop_db
+async def test_discard_draft_character(character_factory, trait_factory):
+    """Test the discard draft character function."""
+    # GIVEN two draft characters which each have a trait
+    draft = character_factory.build(type_chargen=True, traits=[])
+    await draft.insert()
+    other = character_factory.build(type_chargen=True, traits=[])
+    await other.insert()
+
+    await draft.add_trait(trait_factory.build(name="Strength", category_name="PHYSICAL"))
+    other_trait = await other.add_trait(
+        trait_factory.build(name="Strength", category_name="PHYSICAL")
+    )
+
+    # WHEN one of the drafts is discarded
+    await discard_draft_character(draft)
+
+    # THEN only that character and its traits are deleted
+    assert await Character.get(draft.id) is None
+    assert await Character.get(other.id) is not None
+    assert await CharacterTrait.find(CharacterTrait.character == str(draft.id)).count() == 0
+    assert await CharacterTrait.get(other_trait.id) == other_trait
@@ -13,6 +13,7 @@ from valentina.constants import (
     PermissionsManageTraits,
 )
 from valentina.controllers import PermissionManager
+from valentina.models import Character
 from valentina.models.guild import GuildPermissions
 
 
@@ -255,3 +256,35 @@ async def test_can_kill_character(
     assert (
         await manager.can_kill_character(author_id=user1.id, character_id=character.id) == expected
     )
+
+
+@pytest.mark.drop_db
+async def test_can_kill_character_with_loaded_character(
+    guild_factory, user_factory, character_factory, mocker
+) -> None:
+    """Test that a provided character is used instead of fetching it from the database."""
+    # GIVEN a guild where only character owners can kill characters
+    guild = guild_factory.build(
+        permissions=GuildPermissions(
+            kill_character=PermissionsKillCharacter.CHARACTER_OWNER_ONLY,
+            manage_traits=PermissionsManageTraits.CHARACTER_OWNER_ONLY,
+        ),
+        administrators=[],
+        storytellers=[],
+    )
+    await guild.insert()
+    user1 = user_factory.build()
+    character = character_factory.build(user_owner=user1.id)
+    spy = mocker.spy(Character, "get")
+
+    # WHEN checking permissions with an already loaded character
+    manager = PermissionManager(guild.id)
+    assert await manager.can_kill_character(
+        author_id=user1.id, character_id=str(character.id), character=character
+    )
+    assert await manager.can_manage_traits(
+        author_id=user1.id, character_id=str(character.id), character=character
+    )
+
+    # THEN the character is not fetched from the database
+    spy.assert_not_called()
@@ -5,7 +5,7 @@ import pytest
 
 from tests.factories import *
 from valentina.constants import CharacterConcept, CharClass, HunterCreed, TraitCategory, VampireClan
-from valentina.models import Campaign, Character, CharacterTrait
+from valentina.models import Campaign, Character, CharacterListing, CharacterTrait
 from valentina.utils import errors
 
 
@@ -125,6 +125,77 @@ async def test_add_trait(character_factory) -> None:
     assert await CharacterTrait.get(new_trait.id) == new_trait
 
 
+@pytest.mark.drop_db
+async def test_add_traits(character_factory, trait_factory) -> None:
+    """Test the add_traits method."""
+    # GIVEN a character with an existing trait
+    existing_trait = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+    )
+    await existing_trait.insert()
+    character = character_factory.build(traits=[existing_trait])
+    await character.insert()
+
+    # WHEN adding multiple traits including a duplicate of the existing trait
+    new_traits = [
+        CharacterTrait(
+            category_name=TraitCategory.PHYSICAL.name,
+            name="Dexterity",
+            value=3,
+            max_value=5,
+            character="something",
+        ),
+        CharacterTrait(
+            category_name=TraitCategory.PHYSICAL.name,
+            name="strength",
+            value=4,
+            max_value=5,
+            character="something",
+        ),
+        CharacterTrait(
+            category_name=TraitCategory.SOCIAL.name,
+            name="Charisma",
+            value=1,
+            max_value=5,
+            character="something",
+        ),
+    ]
+    added_traits = await character.add_traits(new_traits)
+
+    # THEN only the new traits are added to the character and the database
+    assert [x.name for x in added_traits] == ["Dexterity", "Charisma"]
+    char = await Character.get(character.id, fetch_links=True)
+    assert [x.name for x in char.traits] == ["Strength", "Dexterity", "Charisma"]
+    for trait in added_traits:
+        assert trait.character == str(char.id)
+        assert await CharacterTrait.get(trait.id) == trait
+
+
+@pytest.mark.drop_db
+async def test_delete_trait(character_factory, trait_factory) -> None:
+    """Test the delete_trait method."""
+    # GIVEN a character with two traits
+    strength = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+    )
+    dexterity = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Dexterity", value=3, max_value=5
+    )
+    await strength.insert()
+    await dexterity.insert()
+    character = character_factory.build(traits=[strength, dexterity])
+    await character.insert()
+
+    # WHEN deleting one of the traits
+    await character.delete_trait(str(strength.id))
+
+    # THEN the trait is removed from the character and the database
+    char = await Character.get(character.id, fetch_links=True)
+    assert [x.name for x in char.traits] == ["Dexterity"]
+    assert await CharacterTrait.get(strength.id) is None
+    assert await CharacterTrait.get(dexterity.id) == dexterity
+
+
 @pytest.mark.no_db
 async def test_fetch_trait_by_name(character_factory, trait_factory):
     """Test the fetch_trait_by_name method."""
@@ -167,3 +238,23 @@ async def test_concept_description(character_factory):
         "2. **True Faith:** Starts with a Faith of `3`, equivalent to a Discipline.  Clerics can repel supernatural beings for every success on a Faith role."
         in concept_description
     )
+
+
+@pytest.mark.drop_db
+async def test_character_listing_projection(character_factory):
+    """Test projecting characters onto CharacterListing."""
+    # GIVEN a character with a nickname
+    character = character_factory.build(
+        name_first="John", name_last="Doe", name_nick="JD", char_class_name="MORTAL"
+    )
+    await character.insert()
+
+    # WHEN the character is fetched as a listing
+    listings = (
+        await Character.find(Character.id == character.id).project(CharacterListing).to_list()
+    )
+
+    # THEN only the listed fields are returned and the full name matches the character
+    assert len(listings) == 1
+    assert listings[0].full_name == character.full_name
+    assert listings[0].char_class_name == "MORTAL"
@@ -4,6 +4,7 @@
 import pytest
 
 from tests.factories import *
+from valentina.models import User
 from valentina.utils import errors
 
 
@@ -35,6 +36,10 @@ async def test_add_experience(user_factory, campaign_factory) -> None:
     assert user.campaign_experience[string_id].xp_total == 30
     assert user.fetch_campaign_xp(campaign) == (30, 30, 0)
 
+    # THEN check that the experience is persisted to the database
+    db_user = await User.get(user.id)
+    assert db_user.fetch_campaign_xp(campaign) == (30, 30, 0)
+
 
 async def test_add_campaign_cool_points(user_factory, campaign_factory) -> None:
     """Test the add_campaign_cool_points method."""
@@ -58,6 +63,26 @@ async def test_add_campaign_cool_points(user_factory, campaign_factory) -> None:
     assert user.fetch_campaign_xp(campaign) == (20, 20, 2)
 
 
+async def test_add_experience_from_stale_copies(user_factory, campaign_factory) -> None:
+    """Test that experience added through separate copies of a user is not lost."""
+    # GIVEN a user and a campaign, and two separately fetched copies of the user
+    user = user_factory.build()
+    campaign = campaign_factory.build()
+    await campaign.insert()
+    await user.insert()
+    first_copy = await User.get(user.id)
+    second_copy = await User.get(user.id)
+
+    # WHEN each copy adds experience and cool points without refreshing
+    await first_copy.add_campaign_xp(campaign, 10)
+    await second_copy.add_campaign_cool_points(campaign, 1)
+
+    # THEN both grants are persisted and the second copy reflects the database
+    db_user = await User.get(user.id)
+    assert db_user.fetch_campaign_xp(campaign) == (20, 20, 1)
+    assert second_copy.fetch_campaign_xp(campaign) == (20, 20, 1)
+
+
 async def test_spend_spend_campaign_xp(user_factory, campaign_factory) -> None:
     """Test the spend_campaign_xp method."""
     # GIVEN a new user and a campaign and 20 experience
@@ -87,6 +112,26 @@ async def test_spend_spend_campaign_xp(user_factory, campaign_factory) -> None:
         await user.spend_campaign_xp(campaign, 100)
 
 
+async def test_spend_campaign_xp_from_stale_copy(user_factory, campaign_factory) -> None:
+    """Test that spending experience from a stale copy of a user uses the database balance."""
+    # GIVEN a user with experience and a copy of the user fetched before more experience is granted
+    user = user_factory.build()
+    campaign = campaign_factory.build()
+    await campaign.insert()
+    await user.insert()
+    await user.add_campaign_xp(campaign, 5)
+    stale_copy = await User.get(user.id)
+    await user.add_campaign_xp(campaign, 10)
+
+    # WHEN the stale copy spends more experience than it knows about
+    remaining = await stale_copy.spend_campaign_xp(campaign, 12)
+
+    # THEN the spend succeeds against the database balance and both grants are kept
+    assert remaining == 3
+    db_user = await User.get(user.id)
+    assert db_user.fetch_campaign_xp(campaign) == (3, 15, 0)
+
+
 @pytest.mark.no_db
 async def test_all_user_characters(mock_guild1, user_factory, character_factory) -> None:
     """Test methods related to working with characters associated with the user."""
@@ -6,7 +6,15 @@ import pytest
 from tests.factories import *
 from valentina.constants import TraitCategory
 from valentina.discord.utils import autocomplete
-from valentina.models import CharacterSheetSection
+from valentina.models import CharacterSheetSection, UserMacro
+from valentina.utils.helpers import invalidate_trait_options
+
+
+@pytest.fixture(autouse=True)
+def _clear_trait_option_cache() -> None:
+    """Clear cached autocomplete options so tests sharing a mock channel or user do not leak into each other."""
+    autocomplete.trait_option_cache.clear()
+    autocomplete._macro_option_cache.clear()
 
 
 @pytest.mark.drop_db
@@ -352,6 +360,98 @@ async def test_select_char_trait_two(mock_ctx1, character_factory, trait_factory
     assert result[0].value == str(trait.id)
 
 
+@pytest.mark.drop_db
+async def test_select_char_trait_cached(mock_ctx1, character_factory, trait_factory):
+    """Test that select_char_trait caches options until they are invalidated."""
+    # GIVEN a character with a trait associated with the channel
+    trait = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Dexterity", value=3, max_value=5
+    )
+    await trait.insert()
+    character = character_factory.build(
+        guild=mock_ctx1.interaction.guild.id,
+        channel=mock_ctx1.interaction.channel.id,
+        traits=[trait],
+    )
+    await character.insert()
+    mock_ctx1.options = {"trait": ""}
+    assert len(await autocomplete.select_char_trait(mock_ctx1)) == 1
+
+    # WHEN a second trait is linked to the character without going through the model's trait methods
+    new_trait = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Strength", value=3, max_value=5
+    )
+    await new_trait.insert()
+    character.traits.append(new_trait)
+    await character.save()
+
+    # THEN the cached options are returned
+    assert len(await autocomplete.select_char_trait(mock_ctx1)) == 1
+
+    # WHEN the cache is invalidated
+    invalidate_trait_options(character.guild, character.channel)
+
+    # THEN the new trait is returned
+    result = await autocomplete.select_char_trait(mock_ctx1)
+    assert [x.name for x in result] == ["Dexterity", "Strength"]
+
+
+@pytest.mark.drop_db
+async def test_select_char_trait_after_add_trait(mock_ctx1, character_factory, trait_factory):
+    """Test that adding a trait through the character drops the cached trait options."""
+    # GIVEN a character with a trait associated with the channel and cached trait options
+    trait = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Dexterity", value=3, max_value=5
+    )
+    await trait.insert()
+    character = character_factory.build(
+        guild=mock_ctx1.interaction.guild.id,
+        channel=mock_ctx1.interaction.channel.id,
+        traits=[trait],
+    )
+    await character.insert()
+    mock_ctx1.options = {"trait": ""}
+    assert len(await autocomplete.select_char_trait(mock_ctx1)) == 1
+
+    # WHEN a second trait is added with Character.add_trait
+    new_trait = trait_factory.build(
+        category_name=TraitCategory.PHYSICAL.name, name="Strength", value=3, max_value=5
+    )
+    await character.add_trait(new_trait)
+
+    # THEN the next call returns the new trait
+    result = await autocomplete.select_char_trait(mock_ctx1)
+    assert [x.name for x in result] == ["Dexterity", "Strength"]
+
+
+@pytest.mark.drop_db
+async def test_select_macro_cached(mock_ctx1, user_factory):
+    """Test that select_macro caches options until they are invalidated."""
+    # GIVEN a user with a macro
+    user = user_factory.build(
+        id=mock_ctx1.author.id, macros=[UserMacro(abbreviation="ab", name="first")]
+    )
+    await user.insert()
+    mock_ctx1.interaction.user = mock_ctx1.author
+    mock_ctx1.options = {"macro": "a"}
+    assert [x.name for x in await autocomplete.select_macro(mock_ctx1)] == ["ab (first)"]
+
+    # WHEN a second macro is added to the user
+    user.macros.append(UserMacro(abbreviation="ac", name="second"))
+    await user.save()
+
+    # THEN the cached options are returned
+    assert len(await autocomplete.select_macro(mock_ctx1)) == 1
+
+    # WHEN the cache is invalidated
+    autocomplete.invalidate_macro_options(user.id)
+
+    # THEN the new macro is returned
+    result = await autocomplete.select_macro(mock_ctx1)
+    assert [x.name for x in result] == ["ab (first)", "ac (second)"]
+    assert [x.value for x in result] == [0, 1]
+
+
 @pytest.mark.drop_db
 async def test_select_custom_section(mock_ctx1, character_factory, user_factory):
     """Test the select_custom_section function."""
@@ -11,6 +11,7 @@ from valentina.utils.helpers import (
     get_trait_multiplier,
     get_trait_new_value,
     num_to_circles,
+    pluralize,
     random_string,
     renumber_items,
     truncate_string,
@@ -60,6 +61,14 @@ def test_truncate_string() -> None:
     assert truncate_string("This is a test", 100) == "This is a test"
 
 
+@pytest.mark.no_db
+def test_pluralize() -> None:
+    """Test pluralize()."""
+    assert pluralize("book", 1) == "book"
+    assert pluralize("book", 0) == "books"
+    assert pluralize("ability", 2) == "abilities"
+
+
 @pytest.mark.no_db
 def test_get_trait_new_value() -> None:
     """Test get_trait_new_value()."""